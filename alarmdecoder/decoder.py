@@ -493,12 +493,9 @@ class AlarmDecoder:
         """
         if isinstance(message, BaseMessage) and not self._ignore_message_states:
             self._delegate_update(update_armed_ready_status, message)
-            self._delegate_update(updater.update_power_status, message)
-            self._delegate_update(updater.update_chime_status, message)
+            self._delegate_update(updater.apply_updates, message)
             self._delegate_update(updater.update_alarm_status, message)
             self._delegate_update(updater.update_zone_bypass_status, message)
-            self._delegate_update(updater.update_battery_status, message)
-            self._delegate_update(updater.update_fire_status, message)
         elif isinstance(message, ExpanderMessage):
             self._delegate_update(updater.update_expander_status, message)
             # Always update zone tracking
@@ -49,8 +49,9 @@ class Device:
         Constructor
         """
         self._id = ''
-        self._buffer = b''
+        self._buffer = bytearray()
         self._device = None
+        self._fileno = None
         self._running = False
         self._read_thread = None
 
@@ -101,6 +102,16 @@ class Device:
         """
         raise NotImplementedError("read_line() must be implemented in subclasses")
 
+    def direct_fileno(self):
+        """
+        Returns a file descriptor that carries the device's AD2 stream as-is,
+        so it can be read and written with ``os.read``/``os.write``.
+
+        :returns: file number, or None if the device has no such descriptor
+                  or holds data of its own that raw I/O would skip
+        """
+        return None
+
     def stop_reader(self):
         """
         Stops the reader thread.
@@ -113,6 +124,7 @@ class Device:
         """
         try:
             self._running = False
+            self._fileno = None
             self._read_thread.stop()
             self._device.close()
 
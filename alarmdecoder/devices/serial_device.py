@@ -34,7 +34,7 @@ class SerialDevice(Device):
         super().__init__()
         self._port = interface
         self._id = interface
-        self._buffer = b''
+        self._buffer = bytearray()
         self._device = serial.Serial(timeout=0, writeTimeout=0)
         self._read_thread = None
         self._running = False
@@ -83,6 +83,7 @@ class SerialDevice(Device):
             self._read_thread.start()
 
     def close(self):
+        self._fileno = None
         try:
             if self._read_thread and self._read_thread.is_alive():
                 self._read_thread.stop()
@@ -92,7 +93,18 @@ class SerialDevice(Device):
             logger.warning(f"Error while closing the device: {err}", exc_info=True)
 
     def fileno(self):
-        return self._device.fileno()
+        # Looked up once per open port; close() clears it.
+        if self._fileno is None:
+            self._fileno = self._device.fileno()
+        return self._fileno
+
+    def direct_fileno(self):
+        """
+        Returns the port's file number while no input is buffered.
+
+        :returns: file number, or None if a partial line is buffered
+        """
+        return None if self._buffer else self.fileno()
 
     # Ensure _encode_data is robust (example fix from previous discussion)
     def _encode_data(self, data: str | bytes) -> bytes:
@@ -175,7 +187,7 @@ class SerialDevice(Device):
 
     def read(self) -> str:
         try:
-            read_ready, _, _ = select.select([self._device.fileno()], [], [], 0.5)
+            read_ready, _, _ = select.select([self.fileno()], [], [], 0.5)
             if read_ready:
                 raw_data = filter_ad2prot_byte(self._device.read(1))
                 return raw_data.decode(self.ENCODING)
@@ -186,22 +198,30 @@ class SerialDevice(Device):
 
     def read_line(self, timeout=0.0, purge_buffer=False) -> str:
         if purge_buffer:
-            self._buffer = b''
+            self._buffer.clear()
 
         end_time = time.monotonic() + timeout
-        while timeout == 0.0 or time.monotonic() <= end_time:
-            try:
-                read_ready, _, _ = select.select([self._device.fileno()], [], [], 0.5)
-                if read_ready:
-                    buf = filter_ad2prot_byte(self._device.read(1))
-                    self._buffer += buf
-                    if buf == b'\n':
-                        line = self._buffer.rstrip(b'\r\n')
-                        self._buffer = b''
-                        return line.decode(self.ENCODING)
-            except (OSError, SerialException) as err:
-                logger.error("Error reading a line from device.", exc_info=True)
-                raise CommError(f"Error reading from device: {err}") from err
+        try:
+            while timeout == 0.0 or time.monotonic() <= end_time:
+                # The terminator is found before filtering, since the protocol
+                # filter also drops the CR/LF bytes.
+                line_end = self._buffer.find(b'\n')
+                if line_end >= 0:
+                    line = filter_ad2prot_byte(self._buffer[:line_end])
+                    del self._buffer[:line_end + 1]
+                    return line.decode(self.ENCODING)
+
+                # The port is opened with timeout=0, so this never blocks; drain
+                # everything the driver has queued and only wait on the fd once
+                # it comes back empty.
+                chunk = self._device.read(self._device.in_waiting or 1)
+                if chunk:
+                    self._buffer.extend(chunk)
+                else:
+                    select.select([self.fileno()], [], [], 0.5)
+        except (OSError, SerialException) as err:
+            logger.error("Error reading a line from device.", exc_info=True)
+            raise CommError(f"Error reading from device: {err}") from err
 
         raise TimeoutError("Timeout while reading a line from device.")
 
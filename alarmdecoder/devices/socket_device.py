@@ -12,6 +12,7 @@ SSL if using `ser2sock`_.
 import logging
 import os
 import select
+import selectors
 import socket
 import time
 from typing import cast
@@ -28,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 # --- SSL Import Section (Defines OpenSSL_SSL, crypto, and have_openssl) ---
 try:
+    from OpenSSL import SSL as OpenSSL_SSL
     from OpenSSL import crypto
     have_openssl = True
 
@@ -40,6 +42,9 @@ except ImportError:
         class WantReadError(Exception):
             pass
 
+        class WantWriteError(Exception):
+            pass
+
         class SysCallError(Exception):
             pass
 
@@ -66,6 +71,9 @@ except ImportError:
     have_openssl = False
 # --- End SSL Import Section ---
 
+# Per-call nonblocking recv flag; not available on every platform.
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', None)
+
 
 
 class SocketDevice(Device):
@@ -74,6 +82,15 @@ class SocketDevice(Device):
     exposed via `ser2sock`_ or another Serial to IP interface.
     """
 
+    READ_SIZE = 4096
+    """Maximum number of bytes pulled from the socket per receive in read_line."""
+
+    SSL_HANDSHAKE_TIMEOUT = 10.0
+    """Seconds allowed for the SSL handshake to complete."""
+
+    RECV_BUFFER_SIZE = 262144
+    """Kernel receive buffer size requested for the socket."""
+
     # ... (Properties remain the same) ...
 
     def __init__(self, interface: tuple = ("localhost", 10000)): # Add type hint
@@ -91,8 +108,19 @@ class SocketDevice(Device):
         self._ssl_key = None
         self._ssl_ca = None
         self._ssl_allow_self_signed = False
+        self._tcp_nodelay = True
+        # Built on first SSL open and reused across reconnects; the SSL
+        # property setters clear it.
+        self._ssl_context: OpenSSL_SSL.Context | None = None
         # Initialize _device to None before open
         self._device: socket.socket | OpenSSL_SSL.Connection | None = None
+        # Reusable receive area; read_line() receives into it and copies the
+        # bytes into _buffer instead of allocating a new object per recv().
+        self._recv_view = memoryview(bytearray(self.READ_SIZE))
+        # Small writes made with flush=False, sent as one send().
+        self._write_buf = bytearray()
+        # Readiness selector for the open connection, created by open().
+        self._selector: selectors.BaseSelector | None = None
 
     # ... (open, close, fileno remain mostly the same, ensure _init_ssl uses OpenSSL_SSL) ...
     def open(self, baudrate=None, no_reader_thread=False):
@@ -111,9 +139,14 @@ class SocketDevice(Device):
         self._read_thread = Device.ReadThread(self)
         _sock = None # Temporary socket
 
+        # Drop anything cached for a previous connection
+        self._release_selector()
+        self._fileno = None
+
         try:
             logger.info("Attempting to connect to %s:%d", self._host, self._port)
             _sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._set_socket_options(_sock)
             _sock.connect((self._host, self._port))
             logger.info("Socket connection established.")
 
@@ -123,29 +156,27 @@ class SocketDevice(Device):
                 logger.info("Performing SSL handshake...")
 
                 ssl_conn = cast(Connection, self._device)  # Explicitly cast to fix PyCharm error
-
-                while True:
-                    try:
-                        ssl_conn.do_handshake()
-                        logger.info("SSL handshake successful.")
-                        break
-                    except OpenSSL_SSL.WantReadError:
-                        logger.debug("SSL WantRead during handshake, retrying...")
-                        select.select([ssl_conn], [ssl_conn], [], 0.1)
-                    # Also consider WantWriteError if needed
+                self._do_handshake(ssl_conn, _sock)
+                logger.info("SSL handshake successful.")
             else:
                 self._device = _sock  # Assign the raw socket
 
             self._id = f'{self._host}:{self._port}'
+
+            # One readiness selector per connection; close() releases it.
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(_sock, selectors.EVENT_READ)
             logger.info("Device opened successfully: %s", self._id)
 
         except OSError as err:
             logger.error("Failed to open socket device at %s:%d - %s", self._host, self._port, err, exc_info=True)
+            self._release_selector()
             if _sock:
                 _sock.close()  # Clean up socket if connection failed partially
             raise NoDeviceError(f'Error opening device at {self._host}:{self._port}: {err}') from err
         except Exception as err:  # Catch other potential errors (e.g., SSL setup)
              logger.error("Failed to open/setup device at %s:%d - %s", self._host, self._port, err, exc_info=True)
+             self._release_selector()
              if _sock and not self._device:
                  _sock.close()  # Clean up raw socket if SSL failed
              # Wrap generic errors too
@@ -160,14 +191,116 @@ class SocketDevice(Device):
 
         return self
 
-    def write(self, data: str | bytes) -> int:
+    def close(self):
+        """
+        Closes the device.
+        """
+        self._release_selector()
+        Device.close(self)
+
+    def _wait_readable(self, timeout: float) -> bool:
+        """
+        Waits for the connection to become readable.
+
+        :param timeout: seconds to wait
+        :type timeout: float
+
+        :returns: whether the connection is readable
+        :raises: :py:class:`~alarmdecoder.util.CommError` if the device is closed
+        """
+        selector = self._selector
+        if selector is None:
+            raise CommError("Device not open.")
+        try:
+            return bool(selector.select(timeout))
+        except (OSError, ValueError) as err:
+            # close() released the selector while we were waiting on it
+            raise CommError(f"Device closed while waiting for data: {err}") from err
+
+    def _release_selector(self):
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def _set_socket_options(self, sock: socket.socket):
+        """
+        Applies the latency and buffering options before connecting.  These
+        are tuning only, so a platform that rejects one doesn't fail the open.
+        """
+        options = [(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECV_BUFFER_SIZE)]
+        if self._tcp_nodelay:
+            # AD2 traffic is short keypad and status messages; don't let
+            # Nagle hold them back waiting for more data.
+            options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+
+        for level, option, value in options:
+            try:
+                sock.setsockopt(level, option, value)
+            except OSError as err:
+                logger.debug("Unable to set socket option %d: %s", option, err)
+
+    def fileno(self) -> int:
+        """
+        Returns the file number of the underlying socket, looked up once per
+        connection.
+
+        :returns: file number
+        """
+        if self._fileno is None:
+            self._fileno = self._device.fileno()
+        return self._fileno
+
+    def direct_fileno(self) -> int | None:
+        """
+        Returns the socket's file number for a plain connection with nothing
+        buffered in either direction.  An SSL socket's descriptor carries
+        ciphertext, so it never qualifies.
+
+        :returns: file number, or None
+        """
+        if self._use_ssl or self._buffer or self._write_buf:
+            return None
+        return self.fileno()
+
+    def _do_handshake(self, ssl_conn: 'OpenSSL_SSL.Connection', sock: socket.socket):
+        """
+        Drives the SSL handshake on a non-blocking socket, sleeping in select()
+        on whichever direction OpenSSL is waiting for until it completes or
+        SSL_HANDSHAKE_TIMEOUT runs out.
+
+        :raises: :py:class:`~alarmdecoder.util.TimeoutError`
+        """
+        deadline = time.monotonic() + self.SSL_HANDSHAKE_TIMEOUT
+        sock.setblocking(False)
+        try:
+            while True:
+                try:
+                    ssl_conn.do_handshake()
+                    return
+                except OpenSSL_SSL.WantReadError:
+                    readers, writers = [sock], []
+                except OpenSSL_SSL.WantWriteError:
+                    readers, writers = [], [sock]
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError('Timeout during SSL handshake.')
+                select.select(readers, writers, [], remaining)
+        finally:
+            sock.setblocking(True)
+
+    def write(self, data: str | bytes, flush: bool = True) -> int:
         """
         Writes data to the device.
 
         :param data: data to write (str or bytes)
         :type data: Union[str, bytes]
+        :param flush: send immediately; when False the data is held back and
+                      sent together with later writes, up to the next one
+                      that ends with a carriage return or is flushed
+        :type flush: bool
 
-        :returns: number of bytes sent
+        :returns: number of bytes sent, 0 if the data was buffered
         :raises: :py:class:`~alarmdecoder.util.CommError`, TypeError
         """
         if self._device is None:
@@ -190,8 +323,20 @@ class SocketDevice(Device):
             else:
                 raise TypeError(f"Data must be str or bytes, not {type(data).__name__}")
 
-            logger.debug("Writing to %s: %r", self._id, encoded_data)
-            data_sent = self._device.send(encoded_data) # send() returns int bytes sent
+            if not flush and not encoded_data.endswith(b'\r'):
+                self._write_buf += encoded_data
+                return 0
+            if self._write_buf:
+                # Keep the buffer until the whole batch is out so a failed
+                # send doesn't drop commands queued by earlier writes.
+                encoded_data = bytes(self._write_buf) + encoded_data
+                logger.debug("Writing to %s: %r", self._id, encoded_data)
+                self._device.sendall(encoded_data)
+                self._write_buf.clear()
+                data_sent = len(encoded_data)
+            else:
+                logger.debug("Writing to %s: %r", self._id, encoded_data)
+                data_sent = self._device.send(encoded_data) # send() returns int bytes sent
 
             if data_sent == 0 and len(encoded_data) > 0:
                 logger.warning("Attempted to write %d bytes to %s, but send() returned 0.", len(encoded_data), self._id)
@@ -211,6 +356,8 @@ class SocketDevice(Device):
         except TypeError as type_err: # Catch TypeError from encoding check
              logger.error("Invalid data type for write: %s", type_err, exc_info=True)
              raise type_err # Re-raise
+        except CommError:
+            raise # Already reported; don't wrap it as an unexpected error
         except Exception as general_err: # Catch any other unexpected errors
             logger.error("Unexpected error during write operation on %s.", self._id, exc_info=True)
             raise CommError(f'Unexpected error writing to device: {general_err}') from general_err
@@ -218,6 +365,17 @@ class SocketDevice(Device):
         # Ensure we return an int
         return data_sent if data_sent is not None else 0
 
+    def flush(self) -> int:
+        """
+        Sends any data held back by ``write(..., flush=False)``.
+
+        :returns: number of bytes sent
+        :raises: :py:class:`~alarmdecoder.util.CommError`
+        """
+        if not self._write_buf:
+            return 0
+        return self.write(b'')
+
     def read(self) -> str: # Add return type hint
         """
         Reads a single character (byte) from the device.
@@ -241,10 +399,8 @@ class SocketDevice(Device):
 
 
         try:
-            # Use select for non-blocking check with a short timeout
-            read_ready, _, _ = select.select([self._device], [], [], 0.1) # Short timeout
-
-            if read_ready:
+            # Non-blocking check with a short timeout
+            if self._wait_readable(0.1):
                 data = self._device.recv(1) # Read 1 byte
                 if data == b'':
                      # Socket closed by peer
@@ -266,6 +422,8 @@ class SocketDevice(Device):
         except comm_exceptions_to_catch as err:
             logger.error("Communication error during read on %s.", self._id, exc_info=True)
             raise CommError(f'Error while reading from device: {str(err)}') from err
+        except CommError:
+            raise # Already reported; don't wrap it as an unexpected error
         except Exception as general_err: # Catch any other unexpected errors
             logger.error("Unexpected error during read operation on %s.", self._id, exc_info=True)
             raise CommError(f'Unexpected error reading from device: {general_err}') from general_err
@@ -282,6 +440,53 @@ class SocketDevice(Device):
              return data.decode('utf-8', errors='replace')
 
 
+    def _recv_into_buffer(self, *flags: int) -> int:
+        """
+        Receives one chunk through the reusable receive area and appends it to
+        the line buffer.
+
+        :returns: number of bytes received, 0 if the peer closed the connection
+        """
+        count = self._device.recv_into(self._recv_view, self.READ_SIZE, *flags)
+        self._buffer += self._recv_view[:count]
+        return count
+
+    def _recv_nowait(self) -> int | None:
+        """
+        Receives whatever is already available without blocking.
+
+        :returns: number of bytes received, or None if the caller has to wait
+                  for the socket
+        """
+        if have_openssl and isinstance(self._device, OpenSSL_SSL.Connection):
+            # Decrypted data can sit in the SSL buffer while the socket itself
+            # reports nothing to select().
+            if not self._device.pending():
+                return None
+            return self._recv_into_buffer()
+
+        if _MSG_DONTWAIT is None:
+            return None
+        try:
+            return self._recv_into_buffer(_MSG_DONTWAIT)
+        except BlockingIOError:
+            return None
+
+    def _take_line(self, line_end: int) -> bytes:
+        """
+        Removes the line terminated at line_end from the buffer.
+
+        :returns: the line without its CR/LF terminator
+        """
+        # Copy straight out of the buffer, CR already excluded, instead of
+        # slicing the bytearray first; the view has to be released before the
+        # buffer can shrink.
+        stop = line_end - 1 if line_end and self._buffer[line_end - 1] == 0x0D else line_end
+        with memoryview(self._buffer) as view:
+            line = bytes(view[:stop])
+        del self._buffer[:line_end + 1]
+        return line
+
     def read_line(self, timeout: float = 0.0, purge_buffer: bool = False) -> str: # Add hints
         """
         Reads a line from the device.
@@ -300,19 +505,16 @@ class SocketDevice(Device):
 
         # Purge internal buffer if requested
         if purge_buffer:
-            self._buffer = b''
+            self._buffer.clear()
 
         # Check if a line is already in the buffer
-        try:
-            line_end = self._buffer.index(b"\n")
-            ret = self._buffer[:line_end].rstrip(b"\r")
-            self._buffer = self._buffer[line_end+1:]
+        line_end = self._buffer.find(b"\n")
+        if line_end >= 0:
+            ret = self._take_line(line_end)
             decoded_ret = ret.decode('utf-8', errors='replace') # Decode here
             logger.debug("Read from buffer: %s", decoded_ret)
             self.on_read(data=ret) # Emit event with original bytes
             return decoded_ret
-        except ValueError:
-            pass # No newline found yet
 
         # Set up for reading from socket
         start_time = time.time() # Need import time
@@ -330,41 +532,43 @@ class SocketDevice(Device):
             while True:
                 # Calculate remaining timeout
                 time_elapsed = time.time() - start_time
+                if timeout > 0.0 and time_elapsed >= timeout:
+                    # Data kept arriving but never completed a line
+                    logger.warning("Timeout waiting for line terminator on %s", self._id)
+                    raise TimeoutError('Timeout while waiting for line terminator.')
                 remaining_timeout = max(0.0,
                                         timeout - time_elapsed) if timeout > 0.0 else 0.05  # Short poll if timeout=0
 
-                # Wait for data availability
-                read_ready, _, _ = select.select([self._device], [], [], remaining_timeout)
-
-                if not read_ready:
-                    # Timeout occurred
-                    elapsed = time.time() - start_time
-
-                    if timeout > 0.0 and elapsed >= timeout:
-                        logger.warning("Timeout waiting for line terminator on %s", self._id)
-                        raise TimeoutError('Timeout while waiting for line terminator.')
-                    elif timeout == 0.0:  # Non-blocking check failed
-                        raise TimeoutError('No line immediately available (non-blocking).')
-                    else:
-                        continue  # Retry the loop
-
-                # Data is ready, read a chunk
                 try:
-                    chunk = self._device.recv(128)
-                    if chunk == b'':
+                    # Optimistic read first; only wait on the socket once
+                    # nothing is immediately available.
+                    count = self._recv_nowait()
+                    if count is None:
+                        if not self._wait_readable(remaining_timeout):
+                            # Timeout occurred
+                            elapsed = time.time() - start_time
+
+                            if timeout > 0.0 and elapsed >= timeout:
+                                logger.warning("Timeout waiting for line terminator on %s", self._id)
+                                raise TimeoutError('Timeout while waiting for line terminator.')
+                            elif timeout == 0.0:  # Non-blocking check failed
+                                raise TimeoutError('No line immediately available (non-blocking).')
+                            else:
+                                continue  # Retry the loop
+
+                        # Data is ready, drain as much as the socket holds
+                        count = self._recv_into_buffer()
+                    if count == 0:
                         logger.warning("Device %s closed connection during read_line.", self._id)
                         raise CommError("Connection closed by peer.")
 
-                    logger.debug("Read chunk: %r", chunk)
-                    self._buffer += chunk
-                    try:
-                        line_end = self._buffer.index(b"\n")
-                        ret = self._buffer[:line_end].rstrip(b"\r")
-                        self._buffer = self._buffer[line_end+1:]
-                        got_line = True
-                        break
-                    except ValueError:
+                    logger.debug("Read %d bytes", count)
+                    line_end = self._buffer.find(b"\n")
+                    if line_end < 0:
                         continue # No newline yet, continue reading
+                    ret = self._take_line(line_end)
+                    got_line = True
+                    break
 
                 except ssl_specific_exceptions as ssl_err:
                     if isinstance(ssl_err, OpenSSL_SSL.WantReadError):
@@ -378,8 +582,8 @@ class SocketDevice(Device):
         except comm_exceptions_to_catch as err:
             logger.error("Communication error during read_line on %s.", self._id, exc_info=True)
             raise CommError(f'Error reading from device: {str(err)}') from err
-        except TimeoutError:
-            raise # Re-raise timeout explicitly caught logic
+        except (CommError, TimeoutError):
+            raise # Already reported; don't wrap them as unexpected errors
         except Exception as general_err:
             logger.error("Unexpected error during read_line operation on %s.", self._id, exc_info=True)
             raise CommError(f'Unexpected error reading line from device: {general_err}') from general_err
@@ -408,6 +612,27 @@ class SocketDevice(Device):
         if not have_openssl:
             raise ImportError('SSL sockets have been disabled due to missing requirement: pyopenssl.')
 
+        if self._ssl_context is None:
+            self._ssl_context = self._build_ssl_context()
+
+        try:
+            logger.debug("Creating SSL connection object.")
+            # Wrap the provided socket
+            ssl_conn = OpenSSL_SSL.Connection(self._ssl_context, sock)  # type: ignore[arg-type]
+            ssl_conn.set_connect_state()  # type: ignore[attr-defined]
+            return ssl_conn
+
+        except OpenSSL_SSL.Error as err:
+            logger.error("Failed to create SSL connection.", exc_info=True)
+            raise CommError('Error setting up SSL connection.', err) from err
+
+    def _build_ssl_context(self) -> 'OpenSSL_SSL.Context':
+        """
+        Builds the SSL context from the configured key, certificate and CA.
+
+        :returns: The SSL Context object.
+        :raises: :py:class:`~alarmdecoder.util.CommError`
+        """
         try:
             # Use the correct alias OpenSSL_SSL
             ctx = OpenSSL_SSL.Context(OpenSSL_SSL.TLSv1_METHOD)   # type: ignore[arg-type] # Or newer TLS method if appropriate
@@ -457,11 +682,7 @@ class SocketDevice(Device):
                 # PyOpenSSL docs suggest VERIFY_NONE means callback is not called for cert errors.
                 ctx.set_verify(OpenSSL_SSL.VERIFY_NONE, lambda conn, cert, errno, depth, ok: True)  # type: ignore[attr-defined]
 
-            logger.debug("Creating SSL connection object.")
-            # Wrap the provided socket
-            ssl_conn = OpenSSL_SSL.Connection(ctx, sock)  # type: ignore[arg-type]
-            ssl_conn.set_connect_state()  # type: ignore[attr-defined]
-            return ssl_conn
+            return ctx
 
         except OpenSSL_SSL.Error as err:  # Use correct alias
             logger.error("Failed to configure SSL context.", exc_info=True)
@@ -495,14 +716,54 @@ class SocketDevice(Device):
         # For simplicity now, just return ok.
             return ok
 
+    @property
+    def tcp_nodelay(self):
+        return self._tcp_nodelay
+
+    @tcp_nodelay.setter
+    def tcp_nodelay(self, value):
+        self._tcp_nodelay = value
+
+    @property
+    def ssl(self):
+        return self._use_ssl
+
+    @ssl.setter
+    def ssl(self, value):
+        self._use_ssl = value
+
     @property
     def ssl_key(self):
         return self._ssl_key
 
+    @ssl_key.setter
+    def ssl_key(self, value):
+        self._ssl_key = value
+        self._ssl_context = None
+
     @property
     def ssl_certificate(self):
         return self._ssl_certificate
 
+    @ssl_certificate.setter
+    def ssl_certificate(self, value):
+        self._ssl_certificate = value
+        self._ssl_context = None
+
     @property
     def ssl_ca(self):
         return self._ssl_ca
+
+    @ssl_ca.setter
+    def ssl_ca(self, value):
+        self._ssl_ca = value
+        self._ssl_context = None
+
+    @property
+    def ssl_allow_self_signed(self):
+        return self._ssl_allow_self_signed
+
+    @ssl_allow_self_signed.setter
+    def ssl_allow_self_signed(self, value):
+        self._ssl_allow_self_signed = value
+        self._ssl_context = None
@@ -7,8 +7,6 @@ Refactored for Python 3.11+ with modern structure, error handling, and device de
 import threading
 import time
 
-from alarmdecoder.util.io import bytes_hack
-
 from ..event import event
 from ..util import CommError, NoDeviceError, TimeoutError
 from .base_device import Device
@@ -34,6 +32,7 @@ class USBDevice(Device):
     DEFAULT_VENDOR_ID = PRODUCT_IDS[0][0]
     DEFAULT_PRODUCT_ID = PRODUCT_IDS[0][1]
     BAUDRATE = 115200
+    READ_SIZE = 4096
 
     _devices = []
     _detect_thread = None
@@ -146,7 +145,7 @@ class USBDevice(Device):
         timeout_event.reading = True
 
         if purge_buffer:
-            self._buffer = b''
+            self._buffer.clear()
 
         got_line, ret = False, None
         timer = threading.Timer(timeout, timeout_event)
@@ -155,15 +154,18 @@ class USBDevice(Device):
 
         try:
             while timeout_event.reading:
-                buf = self._device.read_data(1)
+                line_end = self._buffer.find(b'\n')
+                if line_end >= 0:
+                    ret = bytes(self._buffer[:line_end]).rstrip(b'\r')
+                    del self._buffer[:line_end + 1]
+                    if ret:
+                        got_line = True
+                        break
+                    continue
+
+                buf = self._device.read_data(self.READ_SIZE)
                 if buf:
-                    ub = bytes_hack(buf)
-                    self._buffer += ub
-                    if ub == b'\n':
-                        self._buffer = self._buffer.rstrip(b'\r\n')
-                        if self._buffer:
-                            got_line = True
-                            break
+                    self._buffer.extend(buf)
                 else:
                     time.sleep(0.01)
         except (usb.core.USBError, FtdiError) as err:
@@ -172,7 +174,6 @@ class USBDevice(Device):
             timer.cancel()
 
         if got_line:
-            ret, self._buffer = self._buffer, b''
             self.on_read(data=ret)
             return ret
 
@@ -245,33 +246,46 @@ class USBDevice(Device):
         on_attached = event.Event("Device attached")
         on_detached = event.Event("Device detached")
 
+        POLL_INTERVAL = 0.25
+
         def __init__(self, on_attached=None, on_detached=None):
             super().__init__()
             if on_attached:
                 self.on_attached += on_attached
             if on_detached:
                 self.on_detached += on_detached
-            self._running = False
+            self._stop_event = threading.Event()
 
         def stop(self):
-            self._running = False
+            self._stop_event.set()
+
+        @staticmethod
+        def _device_key(device):
+            # find_all() yields (vendor, product, serial, index, description);
+            # bus and address aren't part of it.  The index keeps boards with
+            # no serial number, or a shared one, from collapsing into one key.
+            return tuple(device[:4])
 
         def run(self):
-            self._running = True
-            last_devices = set()
+            last_devices = {}
+            next_scan = time.monotonic()
 
-            while self._running:
+            while not self._stop_event.is_set():
                 try:
-                    current_devices = set(USBDevice.find_all())
+                    current_devices = {self._device_key(dev): dev for dev in USBDevice.find_all()}
 
-                    for dev in current_devices - last_devices:
-                        self.on_attached(device=dev)
+                    for key in current_devices.keys() - last_devices.keys():
+                        self.on_attached(device=current_devices[key])
 
-                    for dev in last_devices - current_devices:
-                        self.on_detached(device=dev)
+                    for key in last_devices.keys() - current_devices.keys():
+                        self.on_detached(device=last_devices[key])
 
                     last_devices = current_devices
-                    time.sleep(0.25)
 
                 except CommError:
                     pass
+
+                # Schedule from the previous scan so enumeration time doesn't
+                # stretch the interval; wakes immediately on stop().
+                next_scan = max(next_scan + self.POLL_INTERVAL, time.monotonic())
+                self._stop_event.wait(next_scan - time.monotonic())
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseMessage:
     """
     Base class for all alarmdecoder messages.
@@ -11,18 +11,10 @@ class BaseMessage:
     raw: str | None = None
     timestamp: datetime | None = None
 
-    # Change this:
-    # def __init__(self):
-    #     ...
-
-    # To this (allow data to be passed, defaulting to None):
     def __init__(self, data=None):
-        # Your existing __init__ logic here...
-        # Make sure you actually *use* the data argument if needed for parsing
-        # e.g., self.raw = data
-        #      if data:
-        #          self.parse(data) # Or similar
-        pass  # Replace pass with actual logic
+        # Slotted fields have no class-level default to fall back on.
+        self.raw = data
+        self.timestamp = None
 
     def dict(self) -> dict:
         return {
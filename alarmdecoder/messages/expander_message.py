@@ -45,7 +45,7 @@ class ExpanderMessage(BaseMessage):
             else:
                 raise InvalidMessageError(f"Unknown expander message header: {data}")
 
-            logger.debug(f"Expander: addr={self.address}, chan={self.channel}, type={self.type}, value={self.value}")
+            logger.debug("Expander: addr=%s, chan=%s, type=%s, value=%s", self.address, self.channel, self.type, self.value)
 
         except ValueError:
             raise InvalidMessageError(f"Received invalid expander message: {data}")
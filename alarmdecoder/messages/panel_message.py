@@ -1,6 +1,7 @@
 # alarmdecoder/messages/panel_message.py
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
+from typing import ClassVar
 
 from alarmdecoder.logger import get_logger
 from alarmdecoder.messages.base_message import BaseMessage
@@ -8,7 +9,7 @@ from alarmdecoder.messages.base_message import BaseMessage
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PanelMessage(BaseMessage):
     """
     A general panel message with possible extensions.
@@ -34,13 +35,20 @@ class PanelMessage(BaseMessage):
     cursor_location: int | None = None
     panel_type: str | None = None
 
+    _DICT_FIELDS: ClassVar[tuple[str, ...]] = ()
+
     def dict(self) -> dict:
-        base = super().dict()
-        base.update(self.__dict__)
+        # Zero-argument super() does not work in slotted dataclasses.
+        base = BaseMessage.dict(self)
+        base.update({name: getattr(self, name) for name in self._DICT_FIELDS})
         return base
 
 
-@dataclass
+# raw/timestamp are serialized by BaseMessage.dict().
+PanelMessage._DICT_FIELDS = tuple(f.name for f in fields(PanelMessage) if f.name not in ("raw", "timestamp"))
+
+
+@dataclass(slots=True)
 class LRRMessage(BaseMessage):
     """
     Represents an LRR (Long Range Radio) message.
@@ -50,7 +58,7 @@ class LRRMessage(BaseMessage):
     timestamp: datetime | None = None
 
     def dict(self):
-        base = super().dict()
+        base = BaseMessage.dict(self)
         base.update({
             "event_type": self.event_type,
             "partition": self.partition,
@@ -59,7 +67,7 @@ class LRRMessage(BaseMessage):
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class AdemcoCIDEvent:
     """
     Represents a parsed ADEMCO Contact ID event.
@@ -71,7 +79,7 @@ class AdemcoCIDEvent:
     partition: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ADEMCOContactID(LRRMessage):
     """
     Specialized LRR message for ADEMCO Contact ID format.
@@ -79,8 +87,8 @@ class ADEMCOContactID(LRRMessage):
     event: AdemcoCIDEvent | None = None
 
     def dict(self):
-        base = super().dict()
+        base = LRRMessage.dict(self)
         base.update({
-            "event": self.event.__dict__ if self.event else None
+            "event": asdict(self.event) if self.event else None
         })
         return base
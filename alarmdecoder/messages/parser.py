@@ -1,5 +1,6 @@
 # alarmdecoder/messages/parser.py
 
+import logging
 import re
 
 from alarmdecoder.logger import get_logger
@@ -10,44 +11,60 @@ from alarmdecoder.util.exceptions import InvalidMessageError
 
 logger = get_logger(__name__)
 
+_TRUTHY = frozenset({"1", "t", "y", "true", "yes", "on"})
+_LOOP_RE = re.compile(r"[01]+")
+_CID_RE = re.compile(r"(\d{3}),(\d),(\d{2}),(\d{3}),(\d)")
+_CID_WIDTHS = (3, 1, 2, 3, 1)
+
+
+def _split_cid(body: str) -> list[str] | None:
+    """
+    Splits a fixed-width ``ddd,d,dd,ddd,d`` CID payload without the regex engine.
+
+    Returns None if the payload does not have the expected shape.
+    """
+    parts = body.split(",")
+    if len(parts) != 5:
+        return None
+    for part, width in zip(parts, _CID_WIDTHS):
+        if len(part) != width or not part.isdigit():
+            return None
+    return parts
+
 
 def parse_message(data: str) -> BaseMessage:
     """
     Entry point for message parsing. Detects type and delegates to handler.
+
+    The line is stripped once here; the ``parse_*`` handlers expect a
+    stripped line. Typed messages are dispatched with a single lookup on
+    their five-character prefix, anything else starting with ``!`` is
+    treated as a panel message.
     """
-    logger.debug(f"Received message: {data}")
+    data = data.strip()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Received message: %s", data)
 
     try:
-        if data.startswith("!AUI:"):
-            logger.debug("Identified as AUI message")
-            return parse_aui(data)
-        elif data.startswith("!EXP:"):
-            logger.debug("Identified as expander message")
-            return parse_expander(data)
-        elif data.startswith("!RFX:"):
-            logger.debug("Identified as RF message")
-            return parse_rf(data)
-        elif data.startswith("!CID:"):
-            logger.debug("Identified as ADEMCO CID message")
-            return parse_ademco_cid(data)
-        elif data.startswith("!LRR:"):
-            logger.debug("Identified as LRR message")
-            return parse_lrr(data)
-        elif data.startswith("!"):
-            logger.debug("Identified as panel message")
-            return parse_panel(data)
-        else:
-            raise InvalidMessageError(f"Unknown message format: {data}")
+        handler = _PREFIX_HANDLERS.get(data[:5])
+        if handler is None:
+            if not data.startswith("!"):
+                raise InvalidMessageError(f"Unknown message format: {data}")
+            handler = parse_panel
+        if debug:
+            logger.debug("Dispatching to %s", handler.__name__)
+        return handler(data)
     except Exception:
-        logger.warning(f"Failed to parse message: {data}", exc_info=True)
+        logger.warning("Failed to parse message: %s", data, exc_info=True)
         raise
 
 
 def parse_panel(data: str) -> PanelMessage:
     """Parses standard panel messages."""
     try:
-        logger.debug(f"Parsing panel message: {data}")
-        text = data.strip()[1:]  # Removes the leading '!'
+        logger.debug("Parsing panel message: %s", data)
+        text = data[1:]  # Removes the leading '!'
         return PanelMessage(
             raw=data,
             text=text,
@@ -67,42 +84,39 @@ def parse_panel(data: str) -> PanelMessage:
             zone_bypassed="BYPASS" in text
         )
     except Exception as ex:
-        logger.error(f"Failed to parse panel message: {data}")
+        logger.error("Failed to parse panel message: %s", data)
         raise InvalidMessageError(f"Failed to parse panel message: {data}") from ex
 
 
 def parse_lrr(data: str) -> LRRMessage:
     """Parses Long Range Radio messages."""
     try:
-        logger.debug(f"Parsing LRR message: {data}")
+        logger.debug("Parsing LRR message: %s", data)
         # Future: Extract event_type, partition, timestamp, etc.
         return LRRMessage(raw=data)
     except Exception as ex:
-        logger.error(f"Failed to parse LRR message: {data}")
+        logger.error("Failed to parse LRR message: %s", data)
         raise InvalidMessageError(f"Failed to parse LRR message: {data}") from ex
 
 
 def parse_ademco_cid(data: str) -> ADEMCOContactID:
     """Parses Contact ID messages, if detected."""
     try:
-        logger.debug(f"Parsing ADEMCO CID message: {data}")
-        # ⚠️ Dummy regex — replace with true ADEMCO CID format
-        match = re.search(r"(\d{3}),(\d),(\d{2}),(\d{3}),(\d)", data)
-        if not match:
-            logger.warning(f"ADEMCO CID format mismatch: {data}")
-            raise InvalidMessageError(f"Could not parse ADEMCO CID: {data}")
-
-        event = AdemcoCIDEvent(
-            code=match.group(1),
-            qualifier=match.group(2),
-            group=match.group(3),
-            zone=match.group(4),
-            partition=match.group(5)
-        )
+        logger.debug("Parsing ADEMCO CID message: %s", data)
+        parts = _split_cid(data.partition(":")[2])
+        if parts is None:
+            # Fall back to a looser scan for payloads with extra framing.
+            match = _CID_RE.search(data)
+            if not match:
+                logger.warning("ADEMCO CID format mismatch: %s", data)
+                raise InvalidMessageError(f"Could not parse ADEMCO CID: {data}")
+            parts = match.groups()
+
+        event = AdemcoCIDEvent(*parts)
         return ADEMCOContactID(raw=data, event=event)
     except Exception as ex:
         if not isinstance(ex, InvalidMessageError):
-            logger.error(f"Failed to parse ADEMCO CID message: {data}")
+            logger.error("Failed to parse ADEMCO CID message: %s", data)
             raise InvalidMessageError(f"Failed to parse ADEMCO CID message: {data}") from ex
         raise
 
@@ -112,12 +126,12 @@ def parse_expander(data: str) -> ExpanderMessage:
     Parses Expander (relay or zone expander) messages.
     """
     try:
-        logger.debug(f"Parsing expander message: {data}")
+        logger.debug("Parsing expander message: %s", data)
         # Example message: !EXP:18,Z,00
-        parts = data.strip()[5:].split(",")
+        parts = data[5:].split(",")
 
         if len(parts) < 3:
-            logger.warning(f"Expander message has insufficient parts: {data}")
+            logger.warning("Expander message has insufficient parts: %s", data)
             raise InvalidMessageError(f"Expander message format invalid (expected at least 3 parts): {data}")
 
         address = parts[0]
@@ -132,7 +146,7 @@ def parse_expander(data: str) -> ExpanderMessage:
         )
     except Exception as ex:
         if not isinstance(ex, InvalidMessageError):
-            logger.error(f"Failed to parse expander message: {data}")
+            logger.error("Failed to parse expander message: %s", data)
             raise InvalidMessageError(f"Failed to parse expander message: {data}") from ex
         raise
 
@@ -142,12 +156,12 @@ def parse_rf(data: str) -> RFMessage:
     Parses RF messages from wireless sensors.
     """
     try:
-        logger.debug(f"Parsing RF message: {data}")
+        logger.debug("Parsing RF message: %s", data)
         # Example message: !RFX:00000001,01,AA,00,C
-        parts = data.strip()[5:].split(",")
+        parts = data[5:].split(",")
 
         if len(parts) < 5:
-            logger.warning(f"RF message has insufficient parts: {data}")
+            logger.warning("RF message has insufficient parts: %s", data)
             raise InvalidMessageError(f"RF message format invalid (expected 5 parts): {data}")
 
         serial_number = parts[0]
@@ -156,23 +170,15 @@ def parse_rf(data: str) -> RFMessage:
         supervision = parts[3]
         value = parts[4]
 
-        # Convert loop string to a list of booleans
-        loop_converted = [c == '1' for c in loop] if isinstance(loop, str) else loop
+        # Pack the loop string into a bitfield, loop 1 in bit 0. int() also
+        # accepts whitespace and '_' separators, so check the digits first.
+        if loop and not _LOOP_RE.fullmatch(loop):
+            raise InvalidMessageError(f"RF message loop field invalid: {data}")
+        loop_bits = int(loop[::-1], 2) if loop else 0
 
         # Convert battery and supervision strings to booleans
-        battery_converted = None
-        if battery is not None:
-            if isinstance(battery, str):
-                battery_converted = battery.lower() in ('true', 'yes', '1', 'on', 't', 'y')
-            else:
-                battery_converted = bool(battery)
-
-        supervision_converted = None
-        if supervision is not None:
-            if isinstance(supervision, str):
-                supervision_converted = supervision.lower() in ('true', 'yes', '1', 'on', 't', 'y')
-            else:
-                supervision_converted = bool(supervision)
+        battery_converted = battery.lower() in _TRUTHY
+        supervision_converted = supervision.lower() in _TRUTHY
 
         # Convert value to integer
         value_converted = int(value) if value and value.strip() else None
@@ -180,14 +186,14 @@ def parse_rf(data: str) -> RFMessage:
         return RFMessage(
             raw=data,
             serial_number=serial_number,
-            loop=loop_converted,
+            loop_bits=loop_bits,
             battery=battery_converted,
             supervision=supervision_converted,
             value=value_converted
         )
     except Exception as ex:
         if not isinstance(ex, InvalidMessageError):
-            logger.error(f"Failed to parse RF message: {data}")
+            logger.error("Failed to parse RF message: %s", data)
             raise InvalidMessageError(f"Failed to parse RF message: {data}") from ex
         raise
 
@@ -197,16 +203,16 @@ def parse_aui(data: str) -> AUIMessage:
     Parses AUI (touchscreen/keypad) messages.
     """
     try:
-        logger.debug(f"Parsing AUI message: {data}")
+        logger.debug("Parsing AUI message: %s", data)
         # Example: !AUI:012345,80,1,Line1 Text,Line2 Text
         if not data.startswith("!AUI:"):
-            logger.warning(f"Invalid AUI message prefix: {data}")
+            logger.warning("Invalid AUI message prefix: %s", data)
             raise InvalidMessageError(f"AUI message must start with '!AUI:': {data}")
 
-        parts = data.strip()[5:].split(",", 4)
+        parts = data[5:].split(",", 4)
 
         if len(parts) < 3:
-            logger.warning(f"AUI message has insufficient parts: {data}")
+            logger.warning("AUI message has insufficient parts: %s", data)
             raise InvalidMessageError(f"AUI message format invalid (expected at least 3 parts): {data}")
 
         aui_id = parts[0]
@@ -222,6 +228,16 @@ def parse_aui(data: str) -> AUIMessage:
         return message
     except Exception as ex:
         if not isinstance(ex, InvalidMessageError):
-            logger.error(f"Failed to parse AUI message: {data}")
+            logger.error("Failed to parse AUI message: %s", data)
             raise InvalidMessageError(f"Failed to parse AUI message: {data}") from ex
         raise
+
+
+# Prefix -> handler for the typed ``!XXX:`` messages, see parse_message().
+_PREFIX_HANDLERS = {
+    "!AUI:": parse_aui,
+    "!EXP:": parse_expander,
+    "!RFX:": parse_rf,
+    "!CID:": parse_ademco_cid,
+    "!LRR:": parse_lrr,
+}
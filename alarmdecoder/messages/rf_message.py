@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+import logging
+from dataclasses import dataclass
 
 from alarmdecoder.logger import get_logger
 from alarmdecoder.messages.base_message import BaseMessage
@@ -6,37 +7,53 @@ from alarmdecoder.util.exceptions import InvalidMessageError
 
 logger = get_logger(__name__)
 
+# (battery, supervision, loop_bits) for every possible status byte.  Loops 1-4
+# live in bits 8, 6, 5 and 7 of the status byte and are packed into bits 0-3.
+_RF_DECODE = tuple(
+    (bool(v & 0x02), bool(v & 0x04), (v >> 7) & 1 | ((v >> 5) & 1) << 1 | ((v >> 4) & 1) << 2 | ((v >> 6) & 1) << 3)
+    for v in range(256)
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class RFMessage(BaseMessage):
     serial_number: str | None = None
     value: int | None = None
     battery: bool | None = None
     supervision: bool | None = None
-    loop: list[bool] = field(default_factory=lambda: [False for _ in range(4)])
+    loop_bits: int = 0
 
     def __post_init__(self):
-        if self.raw:
+        # parse_rf() passes the fields it already decoded; only parse raw
+        # when it is all we were given.
+        if self.raw and self.serial_number is None:
             self._parse_message(self.raw)
 
+    @property
+    def loop(self) -> list[bool]:
+        """
+        Loop states as a list of four booleans.
+        """
+        v = self.loop_bits
+        return [bool(v & 1), bool(v & 2), bool(v & 4), bool(v & 8)]
+
+    def loop_at(self, index: int) -> bool:
+        """
+        Returns the state of a single loop without building the full list.
+        """
+        return bool(self.loop_bits & (1 << index))
+
     def _parse_message(self, data):
         try:
             _, values = data.split(':')
             self.serial_number, value_hex = values.split(',')
             self.value = int(value_hex, 16)
 
-            def is_bit_set(b):
-                return self.value & (1 << (b - 1)) > 0
-
-            self.battery = is_bit_set(2)
-            self.supervision = is_bit_set(3)
-            self.loop[2] = is_bit_set(5)
-            self.loop[1] = is_bit_set(6)
-            self.loop[3] = is_bit_set(7)
-            self.loop[0] = is_bit_set(8)
+            self.battery, self.supervision, self.loop_bits = _RF_DECODE[self.value & 0xFF]
 
-            logger.debug(
-                f"RF parsed: serial={self.serial_number}, battery={self.battery}, supervision={self.supervision}, loops={self.loop}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("RF parsed: serial=%s, battery=%s, supervision=%s, loops=%s",
+                             self.serial_number, self.battery, self.supervision, self.loop)
 
         except ValueError:
             raise InvalidMessageError(f"Received invalid RF message: {data}")
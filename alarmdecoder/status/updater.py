@@ -1,18 +1,68 @@
 # alarmdecoder/status/updater.py
+import logging
+from typing import NamedTuple
+
 from alarmdecoder.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class _StatusFlag(NamedTuple):
+    """
+    A simple on/off status flag carried by panel messages.
+    """
+    field: str  # message attribute
+    cache_attr: str  # device attribute holding the last value
+    event: str  # device event fired on change
+    levels: tuple[int, int]  # (off, on) log levels
+    texts: tuple[str, str]  # (off, on) log text
+    pass_message: bool  # fire with the message instead of the new value
+    ignore_none: bool  # treat None as "no change"
+
+
+_POWER = _StatusFlag("ac_power", "_ac_power", "on_power_changed", (logging.INFO, logging.INFO),
+                     ("Power state changed: AC power is OFF", "Power state changed: AC power is ON"),
+                     pass_message=False, ignore_none=False)
+_CHIME = _StatusFlag("chime_on", "_chime_on", "on_chime_changed", (logging.DEBUG, logging.DEBUG),
+                     ("Chime status changed to: OFF", "Chime status changed to: ON"),
+                     pass_message=True, ignore_none=False)
+_BATTERY = _StatusFlag("battery_low", "_battery", "on_low_battery", (logging.WARNING, logging.WARNING),
+                       ("Battery status changed: BATTERY NORMAL", "Battery status changed: LOW BATTERY"),
+                       pass_message=False, ignore_none=True)
+_FIRE = _StatusFlag("fire_alarm", "_fire", "on_fire", (logging.INFO, logging.CRITICAL),
+                    ("Fire status changed: FIRE ALARM CLEARED", "Fire status changed: FIRE ALARM"),
+                    pass_message=False, ignore_none=True)
+
+_STATUS_UPDATES = (_POWER, _CHIME, _BATTERY, _FIRE)
+
+
+def _apply_status(device, flag, new_status, payload):
+    """
+    Stores a changed status flag on the device, logs it and fires its event.
+    """
+    if (flag.ignore_none and new_status is None) or new_status == getattr(device, flag.cache_attr):
+        return
+
+    logger.log(flag.levels[bool(new_status)], flag.texts[bool(new_status)])
+    setattr(device, flag.cache_attr, new_status)
+    getattr(device, flag.event).fire(device, payload)
+
+
+def apply_updates(device, message):
+    """
+    Applies every simple status flag carried by a panel message in one pass.
+    """
+    for flag in _STATUS_UPDATES:
+        new_status = getattr(message, flag.field)
+        _apply_status(device, flag, new_status, message if flag.pass_message else new_status)
+
+
 def update_power_status(device, message=None, status=None):
     """
     Handles AC power status changes.
     """
     new_status = message.ac_power if message else status
-    if new_status != device._ac_power:
-        logger.info(f"Power state changed: AC power is {'ON' if new_status else 'OFF'}")
-        device._ac_power = new_status
-        device.on_power_changed.fire(device, new_status)
+    _apply_status(device, _POWER, new_status, new_status)
 
 
 def update_chime_status(device, message=None, status=None):
@@ -20,10 +70,7 @@ def update_chime_status(device, message=None, status=None):
     Handles chime status changes.
     """
     new_status = message.chime_on if message else status
-    if new_status != device._chime_on:
-        logger.debug(f"Chime status changed to: {'ON' if new_status else 'OFF'}")
-        device._chime_on = new_status
-        device.on_chime_changed.fire(device, message or status)
+    _apply_status(device, _CHIME, new_status, message or status)
 
 
 def update_alarm_status(device, message=None, status=None, zone=None):
@@ -34,7 +81,7 @@ def update_alarm_status(device, message=None, status=None, zone=None):
 
     if new_status and not device._alarm_occurring:
         zone_info = f" in zone {zone}" if zone else ""
-        logger.warning(f"ALARM EVENT OCCURRING{zone_info}")
+        logger.warning("ALARM EVENT OCCURRING%s", zone_info)
         device._alarm_occurring = True
         device.on_alarm.fire(device, zone)
 
@@ -54,12 +101,12 @@ def update_armed_status(device, message=None, status=None, status_stay=None):
 
     if status != device._armed:
         armed_type = "STAY" if status_stay else "AWAY" if status else "DISARMED"
-        logger.info(f"System armed status changed: {armed_type}")
+        logger.info("System armed status changed: %s", armed_type)
         device._armed = status
         device._armed_stay = status_stay
         device.on_arm.fire(device, status_stay)
     elif status_stay != device._armed_stay:
-        logger.info(f"Armed stay status changed: {'ARMED STAY' if status_stay else 'ARMED AWAY'}")
+        logger.info("Armed stay status changed: %s", 'ARMED STAY' if status_stay else 'ARMED AWAY')
         device._armed_stay = status_stay
         device.on_arm.fire(device, status_stay)
 
@@ -68,7 +115,7 @@ def update_armed_ready_status(decoder, message=None):
     if message is not None:
         # Ready status
         if message.ready != decoder._ready:
-            logger.debug(f"Ready status changed: {'READY' if message.ready else 'NOT READY'}")
+            logger.debug("Ready status changed: %s", 'READY' if message.ready else 'NOT READY')
             decoder._ready = message.ready
             decoder.on_ready_changed.fire(decoder, decoder._ready)
 
@@ -96,34 +143,27 @@ def update_battery_status(decoder, message=None, status=None):
     if message is not None:
         status = message.battery_low
 
-    if status is not None and status != decoder._battery:
-        logger.warning(f"Battery status changed: {'LOW BATTERY' if status else 'BATTERY NORMAL'}")
-        decoder._battery = status
-        decoder.on_low_battery.fire(decoder, status)
+    _apply_status(decoder, _BATTERY, status, status)
 
 
 def update_fire_status(decoder, message=None, status=None):
     if message is not None:
         status = message.fire_alarm
 
-    if status is not None and status != decoder._fire:
-        log_level = logger.critical if status else logger.info
-        log_level(f"Fire status changed: {'FIRE ALARM' if status else 'FIRE ALARM CLEARED'}")
-        decoder._fire = status
-        decoder.on_fire.fire(decoder, status)
+    _apply_status(decoder, _FIRE, status, status)
 
 
 def update_panic_status(decoder, status=None):
     if status is not None and status != decoder._panic:
         log_level = logger.critical if status else logger.info
-        log_level(f"Panic status changed: {'PANIC ACTIVE' if status else 'PANIC CLEARED'}")
+        log_level("Panic status changed: %s", 'PANIC ACTIVE' if status else 'PANIC CLEARED')
         decoder._panic = status
         decoder.on_panic.fire(decoder, status)
 
 
 def update_expander_status(decoder, message):
     if hasattr(message, "relay") and hasattr(message, "channel") and hasattr(message, "value"):
-        logger.debug(f"Relay changed: relay={message.relay}, channel={message.channel}, value={message.value}")
+        logger.debug("Relay changed: relay=%s, channel=%s, value=%s", message.relay, message.channel, message.value)
         decoder.on_relay_changed.fire(decoder, message)
 
 
@@ -132,10 +172,14 @@ def update_zone_bypass_status(device, message=None, status=None, zone=None):
     Handles zone bypass status changes.
     """
     new_status = message.zone_bypassed if message else status
+    if device._bypass_status.get(zone) == new_status:
+        return
+
+    device._bypass_status[zone] = new_status
     if zone is None:
         logger.warning("Unexpected bypass update with missing zone info")
     else:
-        logger.info(f"Zone {zone} bypass status: {'BYPASSED' if new_status else 'NOT BYPASSED'}")
+        logger.info("Zone %s bypass status: %s", zone, 'BYPASSED' if new_status else 'NOT BYPASSED')
     device.on_bypass.fire(device, new_status)
 
 
@@ -145,7 +189,8 @@ def update_zone_tracker(decoder, message):
     The zonetracker will call the appropriate zone_fault/restore events.
     """
     if decoder._zonetracker is not None:
-        logger.debug(f"Updating zone tracker with message: {message}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updating zone tracker with message: %s", message)
         decoder._zonetracker.update(message)
 
 
@@ -153,7 +198,7 @@ def handle_zone_fault(decoder, zone, *args, **kwargs):
     """
     Fires the zone fault event.
     """
-    logger.warning(f"Zone fault detected in zone {zone}")
+    logger.warning("Zone fault detected in zone %s", zone)
     decoder.on_zone_fault.fire(decoder, zone)
 
 
@@ -161,7 +206,7 @@ def handle_zone_restore(decoder, zone, *args, **kwargs):
     """
     Fires the zone restore event.
     """
-    logger.info(f"Zone {zone} restored to normal state")
+    logger.info("Zone %s restored to normal state", zone)
     decoder.on_zone_restore.fire(decoder, zone)
 
 
@@ -173,5 +218,5 @@ def handle_low_battery(decoder, status=None, *args, **kwargs):
     decoder._battery_low = status
 
     if old_status is not None and old_status != status:
-        logger.warning(f"Battery status changed: {'LOW BATTERY' if status else 'BATTERY NORMAL'}")
+        logger.warning("Battery status changed: %s", 'LOW BATTERY' if status else 'BATTERY NORMAL')
         decoder.on_low_battery.fire(decoder, status)
@@ -6,13 +6,126 @@ Implements Intel HEX parsing, bootloader interaction, and retry logic.
 """
 
 import logging
+import os
+import select
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from itertools import islice
+from typing import IO
 
-from alarmdecoder.util.exceptions import NoDeviceError, UploadChecksumError, UploadError
+from alarmdecoder.util.exceptions import NoDeviceError, TimeoutError, UploadChecksumError, UploadError
 
 logger = logging.getLogger(__name__)
 
+# Safety net for a bootloader that stops acknowledging records.
+_ACK_TIMEOUT_MS = 5000
+
+
+def _noop(*args, **kwargs) -> None:
+    """
+    Discards its arguments; stands in for an optional callback.
+    """
+
+
+def _iter_hex(hexfile: IO[bytes]) -> Iterator[bytes]:
+    """
+    Yields the Intel HEX records of a firmware file as they are read, already
+    terminated with CRLF and ready to send.
+    """
+    for line in hexfile:
+        if line.startswith(b":"):
+            yield line.strip() + b"\r\n"
+
+
+# Each reap reports how many records were acknowledged and, if the bootloader
+# rejected one, its response.
+_Reap = tuple[int, bytes | None]
+
+
+def _device_io(device) -> tuple[Callable[[bytes], None], Callable[[], _Reap]]:
+    """
+    Builds send/reap functions on top of the device's own write/read_line.
+    """
+    def reap() -> _Reap:
+        response = device.read_line(timeout=_ACK_TIMEOUT_MS / 1000)
+        if isinstance(response, str):
+            response = response.encode("ascii", "replace")
+        response = response.strip()
+        return (1, None) if response.startswith(b">") else (0, response)
+
+    return device.write, reap
+
+
+def _fd_io(device) -> tuple[Callable[[bytes], None], Callable[[], _Reap]] | None:
+    """
+    Builds send/reap functions that talk to the device's file descriptor
+    directly with os.write/os.read, skipping the device wrapper per record.
+    Every complete response line already received is reaped at once; the
+    device's on_write/on_read events still fire.
+
+    Returns None unless the device hands out a descriptor through
+    direct_fileno().
+    """
+    poll = getattr(select, "poll", None)
+    direct_fileno = getattr(device, "direct_fileno", None)
+    if poll is None or direct_fileno is None:
+        return None
+    try:
+        fd = direct_fileno()
+        if fd is None:
+            return None
+        reader = poll()
+        reader.register(fd, select.POLLIN)
+        writer = poll()
+        writer.register(fd, select.POLLOUT)
+    except Exception:
+        return None
+
+    received = bytearray()
+
+    def send(data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(fd, view):]
+            except BlockingIOError:
+                # Serial ports are opened non-blocking; wait for the driver
+                # to drain its output buffer.
+                if not writer.poll(_ACK_TIMEOUT_MS):
+                    raise TimeoutError("Timed out waiting for the device to accept data.")
+            except OSError as err:
+                raise UploadError(f"Error writing to device: {err}") from err
+        device.on_write(data=data)
+
+    def reap() -> _Reap:
+        while (end := received.rfind(b"\n")) < 0:
+            if not reader.poll(_ACK_TIMEOUT_MS):
+                raise TimeoutError("Timed out waiting for the bootloader to acknowledge a record.")
+            try:
+                chunk = os.read(fd, 4096)
+            except BlockingIOError:
+                continue
+            except OSError as err:
+                raise UploadError(f"Error reading from device: {err}") from err
+            if not chunk:
+                raise UploadError("Device closed during firmware upload.")
+            received.extend(chunk)
+
+        block = received[:end + 1]
+        del received[:end + 1]
+
+        # Every line must be an ACK; stop at the first one that is not.
+        responses = block.split(b"\n")[:-1]
+        for acked, response in enumerate(responses):
+            response = bytes(response.strip())
+            device.on_read(data=response)
+            if not response.startswith(b">"):
+                return acked, response
+        return len(responses), None
+
+    return send, reap
+
 
 class Firmware:
     STAGE_START = "start"
@@ -31,6 +144,7 @@ class Firmware:
         firmware_path: str,
         debug: bool = False,
         progress_callback: Callable[[str], None] | None = None,
+        window_size: int = 8,
     ) -> None:
         """
         Uploads firmware to the device using Intel HEX.
@@ -40,13 +154,17 @@ class Firmware:
             firmware_path: Path to the firmware `.hex` file.
             debug: Enable verbose debug mode.
             progress_callback: Optional callback to receive stage updates.
+            window_size: Number of lines kept in flight before waiting on an ACK.
 
         Raises:
             UploadError, UploadChecksumError, TimeoutError, NoDeviceError
+            ValueError: If window_size is less than 1.
         """
-        def emit(stage: str) -> None:
-            if progress_callback:
-                progress_callback(stage)
+        if window_size < 1:
+            raise ValueError(f"window_size must be at least 1, got {window_size}")
+
+        emit = progress_callback if progress_callback is not None else _noop
+        emit_log = logger.debug if debug and logger.isEnabledFor(logging.DEBUG) else _noop
 
         emit(cls.STAGE_START)
 
@@ -55,31 +173,44 @@ class Firmware:
             raise NoDeviceError("No device specified for firmware upload.")
 
         emit(cls.STAGE_LOAD)
-        with open(firmware_path) as hexfile:
-            hex_lines = [line.strip() for line in hexfile if line.startswith(":")]
-
-        emit(cls.STAGE_BOOT)
-        device.write(b"\n\n+++")
-        time.sleep(2)
-        device.write(b"\n")
-
-        emit(cls.STAGE_UPLOADING)
-
-        for line in hex_lines:
-            if debug:
-                logger.debug("Sending: %s", line)
-
-            device.write(line.encode("ascii") + b"\r\n")
-            time.sleep(0.01)
-
-            response = device.read_line().strip()
-            if debug:
-                logger.debug("Response: %s", response)
-
-            if not response.startswith(b">"):
-                if line[7:9] == "01":
-                    raise UploadChecksumError(f"Checksum error in {firmware_path}")
-                raise UploadError("Incorrect data sent to bootloader.")
+        with open(firmware_path, "rb", buffering=1 << 20) as hexfile:
+            lines = _iter_hex(hexfile)
+
+            emit(cls.STAGE_BOOT)
+            device.write(b"\n\n+++")
+            time.sleep(2)
+            device.write(b"\n")
+
+            emit(cls.STAGE_UPLOADING)
+            send, reap = _fd_io(device) or _device_io(device)
+
+            # Keep up to window_size lines outstanding; each ACK frees a slot that
+            # is refilled on the next pass, so writes overlap the device turnaround.
+            pending: deque[bytes] = deque()
+            while True:
+                batch = list(islice(lines, window_size - len(pending)))
+                if batch:
+                    emit_log("Sending: %s", batch)
+                    send(b"".join(batch))
+                    pending.extend(batch)
+
+                if not pending:
+                    break
+
+                acked, response = reap()
+                emit_log("Acknowledged: %d, response: %s", acked, response)
+                if acked > len(pending):
+                    raise UploadError("Bootloader acknowledged more records than were sent.")
+                for _ in range(acked):
+                    pending.popleft()
+
+                if response is not None:
+                    if not pending:
+                        raise UploadError(f"Unexpected response from bootloader: {response!r}")
+                    line = pending.popleft()
+                    if line[7:9] == b"01":
+                        raise UploadChecksumError(f"Checksum error in {firmware_path}")
+                    raise UploadError("Incorrect data sent to bootloader.")
 
         emit(cls.STAGE_WAITING)
         time.sleep(1)
@@ -6,10 +6,20 @@ and low-level data manipulation for AlarmDecoder devices.
 """
 
 
+import binascii
+import mmap
+import os
+import re
 import select
 
 from alarmdecoder.util.exceptions import UploadChecksumError, UploadError
 
+# Control characters and DEL, stripped from the AD2 protocol stream.
+_DELETE = bytes([b for b in range(256) if b < 0x20 or b == 0x7F])
+
+# Any line whose first non-blank character is ':' is treated as a record.
+_RECORD_LINE = re.compile(rb"^[ \t]*:([^\r\n]*)", re.M)
+
 
 def bytes_available(device) -> int:
     """
@@ -30,11 +40,11 @@ def bytes_hack(buf: str | bytes) -> bytes:
     return buf.encode("utf-8") if isinstance(buf, str) else buf
 
 
-def filter_ad2prot_byte(buf: bytes) -> bytes:
+def filter_ad2prot_byte(buf: bytes | bytearray) -> bytes | bytearray:
     """
     Filters out special control characters from AlarmDecoder protocol stream.
     """
-    return bytes([b for b in buf if b >= 0x20 and b != 0x7F])
+    return buf.translate(None, _DELETE)
 
 
 def read_firmware_file(file_path: str) -> list[str]:
@@ -45,22 +55,28 @@ def read_firmware_file(file_path: str) -> list[str]:
         UploadChecksumError: If a checksum mismatch is detected.
         UploadError: If the data is malformed or incorrect.
     """
-    with open(file_path) as hexfile:
-        lines = []
-        for line_number, line in enumerate(hexfile, 1):
-            line = line.strip()
-            if not line.startswith(":"):
-                continue
-
-            # Verify checksum (Intel HEX format)
-            try:
-                byte_data = bytes.fromhex(line[1:])
-                checksum = sum(byte_data) & 0xFF
-                if checksum != 0:
+    with open(file_path, "rb") as hexfile:
+        if os.fstat(hexfile.fileno()).st_size == 0:
+            return []
+
+        with mmap.mmap(hexfile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lines = []
+            for record in _RECORD_LINE.finditer(data):
+                payload = record[1].rstrip()
+                # unhexlify validates and decodes in the same pass; it only
+                # raises for a record that is not whole hex byte pairs.
+                try:
+                    record_bytes = binascii.unhexlify(payload)
+                except binascii.Error:
+                    record_bytes = b""
+                if not record_bytes:
+                    raise UploadError("Incorrect data sent to bootloader.")
+
+                # Intel HEX records sum to zero modulo 256, checksum byte included.
+                if sum(record_bytes) & 0xFF:
+                    line_number = data[:record.start()].count(b"\n") + 1
                     raise UploadChecksumError(f"Checksum error on line {line_number} of {file_path}")
-            except Exception:
-                raise UploadError("Incorrect data sent to bootloader.")
 
-            lines.append(line)
+                lines.append(":" + payload.decode("ascii"))
 
-        return lines
+    return lines
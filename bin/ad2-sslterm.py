@@ -2,6 +2,7 @@
 
 import argparse
 import logging
+import os
 import select
 import sys
 import termios
@@ -37,22 +38,29 @@ def restore_terminal_settings(settings):
 
 
 def ssl_terminal(device, running_flag):
+    stdin_fd = sys.stdin.fileno()
+    stdout = sys.stdout.buffer
+
     while running_flag[0]:
         readable, _, _ = select.select([sys.stdin, device._device], [], [], 0)
 
         for source in readable:
             if source == sys.stdin:
-                data = source.read(1)
-                if data == '\x03':  # CTRL-C
+                # Forward everything typed or pasted since the last pass in one write.
+                data = os.read(stdin_fd, 4096)
+                ctrl_c = data.find(b'\x03')
+                if ctrl_c != -1:
+                    data = data[:ctrl_c]
+                if data:
+                    device.write(data)
+                if ctrl_c != -1:
                     print("Exiting...")
                     running_flag[0] = False
                     break
-                else:
-                    device.write(data)
             else:
                 data = source.read(1024)
-                sys.stdout.write(data)
-                sys.stdout.flush()
+                stdout.write(data)
+                stdout.flush()
 
 
 def main():
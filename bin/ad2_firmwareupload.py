@@ -1,24 +1,28 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import logging
 import sys
 import time
 import traceback
 
 from alarmdecoder.devices import SerialDevice, SocketDevice
-from alarmdecoder.util.exceptions import NoDeviceError, UploadError
+from alarmdecoder.util.exceptions import CommError, NoDeviceError, UploadError
 from alarmdecoder.util.firmware import Firmware
 
 RETRIES = 3
 RETRY_DELAY = 3  # seconds
+OPEN_DELAY = 3  # seconds to let a freshly opened device settle
+DEFAULT_BAUDRATE = 115200
 
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Upload firmware to an AlarmDecoder device.")
     parser.add_argument("firmware", help="Path to the firmware file.")
-    parser.add_argument("device", help="Device path or host:port (e.g. /dev/ttyUSB0 or 192.168.0.10:10000)")
-    parser.add_argument("--baudrate", type=int, default=115200, help="Baudrate for serial devices (default: 115200)")
+    parser.add_argument("device", help="Device path or host:port (e.g. /dev/ttyUSB0 or 192.168.0.10:10000); "
+                                       "separate several paths to the same device with commas to fail over between them")
+    parser.add_argument("--baudrate", type=int, default=DEFAULT_BAUDRATE, help=f"Baudrate for serial devices (default: {DEFAULT_BAUDRATE})")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     return parser.parse_args()
 
@@ -31,31 +35,68 @@ def setup_logging(debug=False):
     )
 
 
-def get_device(device_path):
+@functools.lru_cache(maxsize=8)
+def _parse_device_spec(device_path):
     if ':' in device_path:
         host, port = device_path.split(':')
-        return SocketDevice(interface=(host, int(port)))
-    else:
-        return SerialDevice(interface=device_path)
-
-
-def upload_firmware_with_retries(dev, firmware_path, debug=False):
-    for attempt in range(1, RETRIES + 1):
-        try:
-            logging.info(f"Attempt {attempt} of {RETRIES} to upload firmware...")
-            Firmware.upload(dev, firmware_path, debug=debug)
-            logging.info("Firmware uploaded successfully.")
-            return
-        except UploadError as ex:
-            logging.warning(f"Upload failed: {ex}")
-        except Exception as ex:
-            logging.error(f"Unexpected error: {ex}\n{traceback.format_exc()}")
-
-        if attempt < RETRIES:
-            logging.info(f"Retrying in {RETRY_DELAY} seconds...")
-            time.sleep(RETRY_DELAY)
+        return 'socket', host, int(port)
+    return 'serial', device_path, None
+
+
+def get_device(device_path):
+    kind, address, port = _parse_device_spec(device_path)
+    if kind == 'socket':
+        return SocketDevice(interface=(address, port))
+    return SerialDevice(interface=address)
+
+
+def upload_firmware_with_retries(dev, firmware_path, debug=False, baudrate=DEFAULT_BAUDRATE):
+    """
+    Uploads firmware, making up to RETRIES attempts.
+
+    ``dev`` is an open device, a device path, or a list of them.  Devices are
+    used as given and left open for the caller.  Paths are opened on their
+    first attempt, so an unreachable path counts as a failed attempt, and are
+    closed again before returning.  With several entries a failed attempt
+    moves straight on to the next one; the retry delay only applies once
+    every entry has failed.
+
+    Raises NoDeviceError if none of the paths could be opened and
+    RuntimeError if every attempt failed otherwise.
+    """
+    targets = dev if isinstance(dev, list) else [dev]
+    opened = {}
+    try:
+        for attempt in range(1, RETRIES + 1):
+            index = (attempt - 1) % len(targets)
+            device = opened.get(index, targets[index])
+            try:
+                logging.info(f"Attempt {attempt} of {RETRIES} to upload firmware...")
+                if isinstance(device, str):
+                    device = get_device(device)
+                    device.open(baudrate=baudrate, no_reader_thread=True)
+                    opened[index] = device
+                    time.sleep(OPEN_DELAY)
+                Firmware.upload(device, firmware_path, debug=debug)
+                logging.info("Firmware uploaded successfully.")
+                return
+            except UploadError as ex:
+                logging.warning(f"Upload failed: {ex}")
+            except (NoDeviceError, CommError) as ex:
+                logging.warning(f"Device unavailable: {ex}")
+            except Exception as ex:
+                logging.error(f"Unexpected error: {ex}\n{traceback.format_exc()}")
+
+            if attempt < RETRIES and attempt % len(targets) == 0:
+                logging.info(f"Retrying in {RETRY_DELAY} seconds...")
+                time.sleep(RETRY_DELAY)
+    finally:
+        for device in opened.values():
+            device.close()
 
     logging.error("Firmware upload failed after all retry attempts.")
+    if not opened and all(isinstance(target, str) for target in targets):
+        raise NoDeviceError(f"Unable to open {', '.join(targets)}")
     raise RuntimeError("Firmware upload failed after retries.")
 
 
@@ -67,21 +108,21 @@ def main():
     logging.info(f"Firmware path: {args.firmware}")
     logging.info(f"Baudrate: {args.baudrate}")
 
-    dev = None
+    paths = [path.strip() for path in args.device.split(',')]
     try:
-        dev = get_device(args.device)
-        dev.open(baudrate=args.baudrate, no_reader_thread=True)
-        time.sleep(3)
-        upload_firmware_with_retries(dev, args.firmware, debug=args.debug)
+        upload_firmware_with_retries(paths, args.firmware, debug=args.debug, baudrate=args.baudrate)
 
     except NoDeviceError as ex:
         logging.error(f"No device found: {ex}")
+        return 1
+    except RuntimeError:
+        return 1
     except Exception as ex:
         logging.error(f"Unexpected error: {ex}\n{traceback.format_exc()}")
-    finally:
-        if dev:
-            dev.close()
+        return 1
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
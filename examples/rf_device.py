@@ -38,7 +38,7 @@ def handle_rfx(sender, message):
     Handles RF message events from the AlarmDecoder.
     """
     # Check for our target serial number and loop
-    if message.serial_number == RF_DEVICE_SERIAL_NUMBER and message.loop[0] is True:
+    if message.serial_number == RF_DEVICE_SERIAL_NUMBER and message.loop_at(0):
         print(message.serial_number, 'triggered loop #1')
 
 if __name__ == '__main__':
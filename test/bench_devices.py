@@ -0,0 +1,58 @@
+"""
+End-to-end throughput checks for the device readers.
+
+These feed real bytes through a pseudo-terminal instead of mocking the
+transport, so they measure the cost of the read path itself.  They are not
+collected by default; run them with::
+
+    python -m pytest test/bench_devices.py -m perf -s
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from alarmdecoder.devices import SerialDevice
+
+LINE = b"line\r\n"
+LINE_COUNT = 10000
+
+
+def _feed(fd, data):
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+@pytest.fixture
+def pty_serial_device():
+    master, slave = os.openpty()
+    device = SerialDevice(interface=os.ttyname(slave))
+    device.open(no_reader_thread=True)
+
+    yield device, master
+
+    device.close()
+    os.close(master)
+    os.close(slave)
+
+
+@pytest.mark.perf
+def test_serial_read_line_throughput(pty_serial_device):
+    device, master = pty_serial_device
+
+    writer = threading.Thread(target=_feed, args=(master, LINE * LINE_COUNT))
+    start = time.perf_counter()
+    writer.start()
+
+    for _ in range(LINE_COUNT):
+        assert device.read_line(timeout=5) == "line"
+
+    elapsed = time.perf_counter() - start
+    writer.join()
+
+    print(f"\nSerialDevice.read_line: {LINE_COUNT} lines in {elapsed:.3f}s "
+          f"({LINE_COUNT * len(LINE) / elapsed / 1024:.0f} KiB/s)")
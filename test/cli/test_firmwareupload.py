@@ -1,14 +1,16 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import bin.ad2_firmwareupload as cli  # update import if needed
+from alarmdecoder.util.exceptions import NoDeviceError, UploadError
 
 
 class TestFirmwareUploader(unittest.TestCase):
 
+    @patch("bin.ad2_firmwareupload.time.sleep")
     @patch("bin.ad2_firmwareupload.Firmware.upload")
     @patch("bin.ad2_firmwareupload.get_device")
-    def test_upload_successful(self, mock_get_device, mock_upload):
+    def test_upload_successful(self, mock_get_device, mock_upload, mock_sleep):
         mock_dev = MagicMock()
         mock_get_device.return_value = mock_dev
 
@@ -27,6 +29,57 @@ class TestFirmwareUploader(unittest.TestCase):
 
         self.assertEqual(mock_upload.call_count, cli.RETRIES)
 
+    @patch("bin.ad2_firmwareupload.time.sleep")
+    @patch("bin.ad2_firmwareupload.Firmware.upload", side_effect=[UploadError("fail"), None])
+    def test_fails_over_to_next_device(self, mock_upload, mock_sleep):
+        primary, fallback = MagicMock(), MagicMock()
+
+        cli.upload_firmware_with_retries([primary, fallback], "firmware.hex", debug=False)
+
+        self.assertEqual(mock_upload.call_args_list, [
+            call(primary, "firmware.hex", debug=False),
+            call(fallback, "firmware.hex", debug=False),
+        ])
+        # No retry delay between paths, and caller-owned devices are left alone
+        mock_sleep.assert_not_called()
+        for device in (primary, fallback):
+            device.open.assert_not_called()
+            device.close.assert_not_called()
+
+    @patch("bin.ad2_firmwareupload.time.sleep")
+    @patch("bin.ad2_firmwareupload.Firmware.upload")
+    @patch("bin.ad2_firmwareupload.get_device")
+    def test_unreachable_path_is_a_failed_attempt(self, mock_get_device, mock_upload, mock_sleep):
+        unreachable, fallback = MagicMock(), MagicMock()
+        unreachable.open.side_effect = NoDeviceError("unreachable")
+        mock_get_device.side_effect = [unreachable, fallback]
+
+        cli.upload_firmware_with_retries(["/dev/ttyUSB0", "10.0.0.1:10000"], "firmware.hex", debug=False)
+
+        mock_get_device.assert_has_calls([call("/dev/ttyUSB0"), call("10.0.0.1:10000")])
+        fallback.open.assert_called_once_with(baudrate=cli.DEFAULT_BAUDRATE, no_reader_thread=True)
+        mock_upload.assert_called_once_with(fallback, "firmware.hex", debug=False)
+        self.assertEqual(mock_sleep.call_args_list, [call(cli.OPEN_DELAY)])
+        unreachable.close.assert_not_called()
+        fallback.close.assert_called_once_with()
+
+    @patch("bin.ad2_firmwareupload.time.sleep")
+    @patch("bin.ad2_firmwareupload.Firmware.upload")
+    @patch("bin.ad2_firmwareupload.get_device")
+    def test_main_reports_missing_device(self, mock_get_device, mock_upload, mock_sleep):
+        mock_get_device.return_value.open.side_effect = NoDeviceError("missing")
+
+        with patch("sys.argv", ["ad2_firmwareupload.py", "firmware.hex", "/dev/missing"]), \
+                self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(cli.main(), 1)
+
+        mock_upload.assert_not_called()
+        self.assertIn("No device found", "\n".join(logs.output))
+
+    def test_parse_device_spec(self):
+        self.assertEqual(cli._parse_device_spec("192.168.0.10:10000"), ("socket", "192.168.0.10", 10000))
+        self.assertEqual(cli._parse_device_spec("/dev/ttyUSB0"), ("serial", "/dev/ttyUSB0", None))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pytest
 
-from alarmdecoder.messages import ExpanderMessage
+from alarmdecoder.messages import ExpanderMessage, RFMessage
 from alarmdecoder.messages.panel_message import AdemcoCIDEvent, ADEMCOContactID, LRRMessage, PanelMessage
 from alarmdecoder.messages.parser import parse_message
 from alarmdecoder.util.exceptions import InvalidMessageError
@@ -17,6 +17,37 @@ def test_parse_panel_message():
     assert msg.armed_away is False  # Not present in message
 
 
+def test_parse_panel_message_multiword_flags():
+    msg = parse_message("!FIRE ALARM AC LOSS LOW BATTERY")
+    assert msg.fire_alarm
+    assert msg.alarm_event_occurred
+    assert msg.ac_power is False
+    assert msg.battery_low
+    assert msg.ready is False
+
+
+def test_parse_rf_message_keeps_parsed_fields():
+    msg = parse_message("!RFX:0180036,1000,1,0,12")
+    assert isinstance(msg, RFMessage)
+    assert msg.serial_number == "0180036"
+    assert msg.loop == [True, False, False, False]
+    assert msg.battery is True
+    assert msg.supervision is False
+    assert msg.value == 12
+    assert msg.raw == "!RFX:0180036,1000,1,0,12"
+
+
+@pytest.mark.parametrize("loop", ["1_0", " 10", "102"])
+def test_parse_rf_message_rejects_malformed_loop(loop):
+    with pytest.raises(InvalidMessageError):
+        parse_message(f"!RFX:0180036,{loop},1,0,12")
+
+
+def test_parse_rf_message_flags_ignore_case():
+    msg = parse_message("!RFX:0180036,1000,tRuE,No,12")
+    assert msg.battery is True
+    assert msg.supervision is False
+
 
 def test_parse_expander_message():
     data = "!EXP:18,0,00"
@@ -55,8 +86,40 @@ def test_parse_ademco_cid():
     assert isinstance(msg, ADEMCOContactID)
     assert isinstance(msg.event, AdemcoCIDEvent)
     assert msg.event.code == "601"
+    assert msg.event.qualifier == "1"
+    assert msg.event.group == "02"
     assert msg.event.zone == "456"
+    assert msg.event.partition == "7"
+    assert not hasattr(msg.event, "__dict__")
 
 def test_parse_invalid():
     with pytest.raises(InvalidMessageError):
-        parse_message("UNKNOWN")
\ No newline at end of file
+        parse_message("UNKNOWN")
+
+
+def test_parse_ademco_cid_with_extra_fields():
+    data = "!CID:601,1,02,456,7,ff"
+    msg = parse_message(data)
+    assert isinstance(msg, ADEMCOContactID)
+    assert msg.event.partition == "7"
+
+
+def test_parse_ademco_cid_invalid():
+    with pytest.raises(InvalidMessageError):
+        parse_message("!CID:60A,1,02,456,7")
+
+
+def test_panel_message_dict():
+    msg = parse_message("!READY STAY")
+    data = msg.dict()
+    assert not hasattr(msg, "__dict__")
+    assert data["raw"] == "!READY STAY"
+    assert data["ready"] is True
+    assert data["timestamp"] is None
+
+
+def test_parse_message_strips_line_endings():
+    msg = parse_message("!READY CHIME\r\n")
+    assert isinstance(msg, PanelMessage)
+    assert msg.raw == "!READY CHIME"
+    assert msg.text == "READY CHIME"
@@ -104,4 +104,59 @@ def test_update_zone_tracker_forwards_call():
 
     updater.update_zone_tracker(device, message)
 
-    tracker.update.assert_called_once_with(message)
\ No newline at end of file
+    tracker.update.assert_called_once_with(message)
+
+
+def test_apply_updates_fires_only_changed_flags():
+    device = MagicMock()
+    device._ac_power = True
+    device._chime_on = False
+    device._battery = False
+    device._fire = False
+    message = MagicMock()
+    message.ac_power = True
+    message.chime_on = True
+    message.battery_low = False
+    message.fire_alarm = True
+
+    updater.apply_updates(device, message)
+
+    assert device._chime_on is True
+    assert device._fire is True
+    device.on_chime_changed.fire.assert_called_once_with(device, message)
+    device.on_fire.fire.assert_called_once_with(device, True)
+    device.on_power_changed.fire.assert_not_called()
+    device.on_low_battery.fire.assert_not_called()
+
+
+def test_apply_updates_ignores_none_only_for_battery_and_fire():
+    device = MagicMock()
+    device._ac_power = True
+    device._chime_on = True
+    device._battery = False
+    device._fire = False
+    message = MagicMock()
+    message.ac_power = None
+    message.chime_on = None
+    message.battery_low = None
+    message.fire_alarm = None
+
+    updater.apply_updates(device, message)
+
+    assert device._ac_power is None
+    assert device._chime_on is None
+    device.on_power_changed.fire.assert_called_once_with(device, None)
+    device.on_chime_changed.fire.assert_called_once_with(device, message)
+    device.on_low_battery.fire.assert_not_called()
+    device.on_fire.fire.assert_not_called()
+
+
+def test_update_zone_bypass_status_skips_unchanged():
+    device = MagicMock()
+    device._bypass_status = {}
+
+    updater.update_zone_bypass_status(device, status=True, zone=5)
+    updater.update_zone_bypass_status(device, status=True, zone=5)
+
+    assert device._bypass_status == {5: True}
+    device.on_bypass.fire.assert_called_once_with(device, True)
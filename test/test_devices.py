@@ -1,5 +1,7 @@
+import itertools
 import os
 import select
+import selectors
 import socket
 import tempfile
 import time
@@ -100,8 +102,7 @@ class TestSerialDevice(TestCase):
                         self._device.read()
 
     def test_read_line(self):
-        side_effect = list("testing\r\n")
-        side_effect = [chr(x).encode('utf-8') for x in b"testing\r\n"]
+        side_effect = [b"testing\r\n"]
 
         with patch.object(self._device._device, 'read', side_effect=side_effect):
             with patch('serial.Serial.fileno', return_value=1):
@@ -114,6 +115,18 @@ class TestSerialDevice(TestCase):
 
                     self.assertEqual(ret, "testing")
 
+    def test_read_line_returns_from_buffer_no_syscall(self):
+        self._device._buffer.extend(b"x\r\ny\r\n")
+
+        with patch.object(self._device._device, 'read') as mock_read:
+            with patch.object(select, 'select') as mock_select:
+                self.assertEqual(self._device.read_line(), "x")
+                self.assertEqual(self._device.read_line(), "y")
+
+        mock_read.assert_not_called()
+        mock_select.assert_not_called()
+        self.assertEqual(self._device._buffer, b"")
+
     def test_read_line_timeout(self):
         with patch.object(self._device._device, 'read', return_value=b'a'):
             with patch('serial.Serial.fileno', return_value=1):
@@ -121,7 +134,7 @@ class TestSerialDevice(TestCase):
                     with self.assertRaises(TimeoutError):
                         self._device.read_line(timeout=0.1)
 
-        self.assertIn('a', self._device._buffer.decode('utf-8'))
+        self.assertIn(b'a', self._device._buffer)
 
     def test_read_line_exception(self):
         with patch.object(self._device._device, 'read', side_effect=[OSError, SerialException]):
@@ -134,10 +147,53 @@ class TestSerialDevice(TestCase):
                         self._device.read_line()
 
 
+def recv_into_side_effect(chunks):
+    """
+    Builds a recv_into() side effect that copies each chunk into the caller's
+    buffer, or raises it if it is an exception.
+    """
+    chunks = iter(chunks)
+
+    def recv_into(buffer, nbytes=0, flags=0):
+        chunk = next(chunks)
+        if isinstance(chunk, type) and issubclass(chunk, BaseException):
+            raise chunk
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
+class FakeSelector:
+    """
+    Stands in for SocketDevice's selector, reporting the connection as
+    readable (or not) and counting the waits.
+    """
+
+    def __init__(self, ready=True):
+        self.ready = ready
+        self.calls = 0
+
+    def register(self, fileobj, events, data=None):
+        pass
+
+    def select(self, timeout=None):
+        self.calls += 1
+        return [(None, selectors.EVENT_READ)] if self.ready else []
+
+    def close(self):
+        pass
+
+
 class TestSocketDevice(TestCase):
     def setUp(self):
         self._device = SocketDevice()
         self._device._device = Mock(spec=socket.socket)
+        self._selector = self._device._selector = FakeSelector()
+        # open() builds its own selector; hand it the fake one as well.
+        patcher = patch.object(selectors, 'DefaultSelector', return_value=self._selector)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def tearDown(self):
         self._device.close()
@@ -150,6 +206,14 @@ class TestSocketDevice(TestCase):
 
         mock.assert_called_with(self._device.interface)
 
+    def test_open_sets_nodelay(self):
+        with patch.object(socket.socket, 'connect', return_value=None):
+            with patch.object(socket.socket, 'setsockopt') as mock:
+                self._device.open(no_reader_thread=True)
+
+        mock.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        mock.assert_any_call(socket.SOL_SOCKET, socket.SO_RCVBUF, SocketDevice.RECV_BUFFER_SIZE)
+
     def test_open_failed(self):
         with patch.object(socket.socket, 'connect', side_effect=socket.error):
             with self.assertRaises(NoDeviceError):
@@ -165,6 +229,51 @@ class TestSocketDevice(TestCase):
 
             mock.assert_called_with(b'test')
 
+    def test_write_buffered(self):
+        with patch.object(socket.socket, '__init__', return_value=None):
+            with patch.object(socket.socket, 'connect', return_value=None):
+                self._device.open(no_reader_thread=True)
+
+            with patch.object(socket.socket, 'sendall', return_value=None) as mock:
+                self._device.write(b'12', flush=False)
+                self._device.write(b'34', flush=False)
+                mock.assert_not_called()
+
+                self.assertEqual(self._device.write(b'*\r', flush=False), 6)
+                mock.assert_called_once_with(b'1234*\r')
+
+                self._device.write(b'5', flush=False)
+                self._device.flush()
+                mock.assert_called_with(b'5')
+
+    def test_selector_lives_with_the_connection(self):
+        with patch.object(socket.socket, '__init__', return_value=None):
+            with patch.object(socket.socket, 'connect', return_value=None):
+                self._device.open(no_reader_thread=True)
+
+        self.assertIs(self._device._selector, self._selector)
+        self._device.close()
+        self.assertIsNone(self._device._selector)
+
+        with self.assertRaises(CommError):
+            self._device._wait_readable(0)
+        self.assertIsNone(self._device._selector)
+        selectors.DefaultSelector.assert_called_once_with()
+
+    def test_write_buffered_exception_keeps_buffer(self):
+        with patch.object(socket.socket, '__init__', return_value=None):
+            with patch.object(socket.socket, 'connect', return_value=None):
+                self._device.open(no_reader_thread=True)
+
+            self._device.write(b'12', flush=False)
+            with patch.object(socket.socket, 'sendall', side_effect=socket.error):
+                with self.assertRaises(CommError):
+                    self._device.write(b'34\r')
+
+            with patch.object(socket.socket, 'sendall', return_value=None) as mock:
+                self._device.flush()
+            mock.assert_called_once_with(b'12')
+
     def test_write_exception(self):
         side_effects = [socket.error]
         if (have_openssl):
@@ -179,53 +288,72 @@ class TestSocketDevice(TestCase):
             with patch.object(socket.socket, 'connect', return_value=None):
                 self._device.open(no_reader_thread=True)
 
-            with patch('socket.socket.fileno', return_value=1):
-                with patch.object(select, 'select', return_value=[[1], [], []]):
-                    with patch.object(socket.socket, 'recv') as mock:
-                        self._device.read()
+            self._device._selector = FakeSelector()
+            with patch.object(socket.socket, 'recv') as mock:
+                self._device.read()
 
             mock.assert_called_with(1)
 
     def test_read_exception(self):
-        with patch('socket.socket.fileno', return_value=1):
-            with patch.object(select, 'select', return_value=[[1], [], []]):
-                with patch.object(self._device._device, 'recv', side_effect=socket.error):
-                    with self.assertRaises(CommError):
-                        self._device.read()
+        with patch.object(self._device._device, 'recv', side_effect=socket.error):
+            with self.assertRaises(CommError):
+                self._device.read()
 
     def test_read_line(self):
-        side_effect = list("testing\r\n")
-        side_effect = [chr(x).encode('utf-8') for x in b"testing\r\n"]
+        side_effect = recv_into_side_effect([b"testing\r\n"])
 
-        with patch('socket.socket.fileno', return_value=1):
-            with patch.object(select, 'select', return_value=[[1], [], []]):
-                with patch.object(self._device._device, 'recv', side_effect=side_effect):
-                    ret = None
-                    try:
-                        ret = self._device.read_line()
-                    except StopIteration:
-                        pass
+        with patch.object(self._device._device, 'recv_into', side_effect=side_effect):
+            ret = None
+            try:
+                ret = self._device.read_line()
+            except StopIteration:
+                pass
+
+        self.assertEqual(ret, "testing")
+
+    def test_read_line_returns_from_buffer_no_syscall(self):
+        self._device._buffer.extend(b"x\r\n")
 
-            self.assertEqual(ret, "testing")
+        with patch.object(self._device._device, 'recv_into') as mock_recv:
+            self.assertEqual(self._device.read_line(), "x")
+
+        mock_recv.assert_not_called()
+        self.assertEqual(self._selector.calls, 0)
+
+    def test_read_line_strips_only_the_terminator(self):
+        self._device._buffer.extend(b"a\nb\r\n\r\n")
+
+        lines = [self._device.read_line() for _ in range(3)]
+
+        self.assertEqual(lines, ["a", "b", ""])
+        self.assertEqual(self._device._buffer, b"")
+
+    def test_read_line_waits_when_nothing_available(self):
+        with patch.object(self._device._device, 'recv_into', side_effect=recv_into_side_effect([BlockingIOError, b"testing\r\n"])):
+            ret = self._device.read_line()
+
+        self.assertEqual(ret, "testing")
+        self.assertEqual(self._selector.calls, 1)
 
     def test_read_line_timeout(self):
-        with patch('socket.socket.fileno', return_value=1):
-            with patch.object(select, 'select', return_value=[[1], [], []]):
-                with patch.object(self._device._device, 'recv', return_value=b'a'):
-                    with self.assertRaises(TimeoutError):
-                        self._device.read_line(timeout=0.1)
+        with patch.object(self._device._device, 'recv_into', side_effect=recv_into_side_effect(itertools.repeat(b'a'))):
+            with self.assertRaises(TimeoutError):
+                self._device.read_line(timeout=0.1)
 
-        self.assertIn('a', self._device._buffer.decode('utf-8'))
+        self.assertIn(b'a', self._device._buffer)
 
     def test_read_line_exception(self):
-        with patch('socket.socket.fileno', return_value=1):
-            with patch.object(select, 'select', return_value=[[1], [], []]):
-                with patch.object(self._device._device, 'recv', side_effect=socket.error):
-                    with self.assertRaises(CommError):
-                        self._device.read_line()
+        with patch.object(self._device._device, 'recv_into', side_effect=socket.error):
+            with self.assertRaises(CommError):
+                self._device.read_line()
 
-                    with self.assertRaises(CommError):
-                        self._device.read_line()
+            with self.assertRaises(CommError):
+                self._device.read_line()
+
+    def test_read_line_connection_closed(self):
+        with patch.object(self._device._device, 'recv_into', return_value=0):
+            with self.assertRaisesRegex(CommError, '^Connection closed by peer'):
+                self._device.read_line()
 
     def test_ssl(self):
         if not have_openssl:
@@ -263,6 +391,42 @@ class TestSocketDevice(TestCase):
         mock.assert_called_with(self._device.interface)
         self.assertIsInstance(self._device._device, SSL.Connection)
 
+    def test_ssl_handshake_wantread(self):
+        if not have_openssl:
+            return
+
+        ssl_conn = Mock(spec=SSL.Connection)
+        ssl_conn.do_handshake.side_effect = [SSL.WantReadError, None]
+        self._device._use_ssl = True
+
+        with patch.object(socket.socket, 'connect', return_value=None):
+            with patch.object(socket.socket, 'setblocking'):
+                with patch.object(self._device, '_init_ssl', return_value=ssl_conn):
+                    with patch.object(select, 'select', return_value=[[1], [], []]) as mock_select:
+                        self._device.open(no_reader_thread=True)
+
+        self.assertIs(self._device._device, ssl_conn)
+        self.assertEqual(ssl_conn.do_handshake.call_count, 2)
+        mock_select.assert_called_once()
+
+    def test_ssl_context_reused(self):
+        if not have_openssl:
+            return
+
+        self._device.ssl = True
+        self._device.ssl_allow_self_signed = True
+
+        sock = socket.socket()
+        with patch.object(self._device, '_build_ssl_context', wraps=self._device._build_ssl_context) as mock:
+            self._device._init_ssl(sock)
+            self._device._init_ssl(sock)
+            self.assertEqual(mock.call_count, 1)
+
+            self._device.ssl_ca = None
+            self._device._init_ssl(sock)
+            self.assertEqual(mock.call_count, 2)
+        sock.close()
+
     def test_ssl_exception(self):
         if not have_openssl:
             return
@@ -336,12 +500,20 @@ if have_pyftdi:
 
                 with patch.object(USBDevice, 'find_all', return_value=[(0, 0, 'AD2-2', 1, 'AD2')]):
                     USBDevice.find_all()
-                    time.sleep(1)
+                    time.sleep(0.5)
                     USBDevice.stop_detection()
 
             self.assertTrue(self._attached)
             self.assertTrue(self._detached)
 
+        def test_device_key_distinguishes_boards_without_serial(self):
+            first = (0, 0, None, 0, 'AD2')
+            second = (0, 0, None, 1, 'AD2')
+
+            key = USBDevice.DetectThread._device_key
+            self.assertNotEqual(key(first), key(second))
+            self.assertEqual(key(first), key((0, 0, None, 0, 'renamed')))
+
         def test_find_all(self):
             with patch.object(USBDevice, 'find_all', return_value=[]):
                 devices = USBDevice.find_all()
@@ -420,7 +592,7 @@ if have_pyftdi:
                     self._device.read()
 
         def test_read_line(self):
-            with patch.object(self._device._device, 'read_data', side_effect=list("testing\r\n")):
+            with patch.object(self._device._device, 'read_data', side_effect=[b"testing\r\n"]) as mock:
                 ret = None
                 try:
                     ret = self._device.read_line()
@@ -428,13 +600,14 @@ if have_pyftdi:
                     pass
 
                 self.assertEqual(ret, b"testing")
+                mock.assert_called_with(USBDevice.READ_SIZE)
 
         def test_read_line_timeout(self):
-            with patch.object(self._device._device, 'read_data', return_value='a'):
+            with patch.object(self._device._device, 'read_data', return_value=b'a'):
                 with self.assertRaises(TimeoutError):
                     self._device.read_line(timeout=0.1)
 
-            self.assertIn('a', self._device._buffer)
+            self.assertIn(b'a', self._device._buffer)
 
         def test_read_line_exception(self):
             with patch.object(self._device._device, 'read_data', side_effect=[USBError('testing'), FtdiError]):
@@ -62,6 +62,16 @@ class TestMessages(TestCase):
         self.assertEqual(msg.serial_number, '0180036')
         self.assertEqual(msg.value, int('80', 16))
 
+    def test_rf_message_status_bits(self):
+        msg = RFMessage('!RFX:0180036,B2')
+
+        self.assertTrue(msg.battery)
+        self.assertFalse(msg.supervision)
+        self.assertEqual(msg.loop, [True, True, True, False])
+        self.assertEqual(msg.loop_bits, 0b0111)
+        self.assertTrue(msg.loop_at(0))
+        self.assertFalse(msg.loop_at(3))
+
     def test_rf_message_parse_fail(self):
         with self.assertRaises(InvalidMessageError):
             RFMessage('')
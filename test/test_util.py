@@ -0,0 +1,228 @@
+import os
+import selectors
+import socket
+import threading
+
+import pytest
+
+from alarmdecoder.devices import SerialDevice, SocketDevice
+from alarmdecoder.util.exceptions import TimeoutError, UploadChecksumError, UploadError
+from alarmdecoder.util.firmware import Firmware, _fd_io
+from alarmdecoder.util.io import bytes_available, read_firmware_file
+
+HEX_LINES = [
+    ":100000000C9434000C9446000C9446000C9446006A",
+    ":100010000C9446000C9446000C9446000C94460048",
+    ":100020000C9446000C9446000C9446000C94460038",
+    ":00000001FF",
+]
+
+
+class FakeBootloader:
+    def __init__(self, responses=None):
+        self.writes = []
+        self.responses = list(responses or [])
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def read_line(self, timeout=0.0):
+        return self.responses.pop(0) if self.responses else b">"
+
+
+@pytest.fixture
+def socket_device():
+    local, remote = socket.socketpair()
+    device = SocketDevice()
+    device._device = local
+    device._selector = selectors.DefaultSelector()
+    device._selector.register(local, selectors.EVENT_READ)
+    yield device, remote
+    device.close()
+    remote.close()
+
+
+@pytest.fixture
+def pty_serial_device():
+    master, slave = os.openpty()
+    device = SerialDevice(interface=os.ttyname(slave))
+    device.open(no_reader_thread=True)
+    yield device, master
+    device.close()
+    os.close(master)
+    os.close(slave)
+
+
+@pytest.fixture
+def firmware_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("alarmdecoder.util.firmware.time.sleep", lambda _: None)
+    path = tmp_path / "firmware.hex"
+    path.write_text("\n".join(HEX_LINES) + "\n")
+    return str(path)
+
+
+def test_upload_keeps_window_of_lines_in_flight(firmware_file):
+    device = FakeBootloader()
+    Firmware.upload(device, firmware_file, window_size=2)
+
+    line_writes = device.writes[2:]
+    assert line_writes[0] == (HEX_LINES[0] + "\r\n" + HEX_LINES[1] + "\r\n").encode("ascii")
+    assert b"".join(line_writes) == "".join(line + "\r\n" for line in HEX_LINES).encode("ascii")
+
+
+@pytest.mark.parametrize("window_size", [0, -1])
+def test_upload_rejects_empty_window(firmware_file, window_size):
+    device = FakeBootloader()
+    with pytest.raises(ValueError):
+        Firmware.upload(device, firmware_file, window_size=window_size)
+    assert device.writes == []
+
+
+def test_upload_rejects_bad_ack(firmware_file):
+    device = FakeBootloader([b">", b"!no"])
+    with pytest.raises(UploadError):
+        Firmware.upload(device, firmware_file)
+
+
+def test_upload_accepts_str_responses(firmware_file):
+    with pytest.raises(UploadError):
+        Firmware.upload(FakeBootloader([">", "!no"]), firmware_file)
+
+    Firmware.upload(FakeBootloader([">"] * len(HEX_LINES)), firmware_file)
+
+
+def test_read_firmware_file_reports_checksum_line(tmp_path):
+    path = tmp_path / "bad.hex"
+    path.write_text(HEX_LINES[0] + "\n" + HEX_LINES[1][:-2] + "00\n")
+    with pytest.raises(UploadChecksumError, match="line 2"):
+        read_firmware_file(str(path))
+
+
+@pytest.mark.parametrize("record", [":10000G", ":1000000", ":10 00"])
+def test_read_firmware_file_rejects_malformed_record(tmp_path, record):
+    path = tmp_path / "bad.hex"
+    path.write_text(record + "\n")
+    with pytest.raises(UploadError):
+        read_firmware_file(str(path))
+
+
+def test_upload_times_out_without_ack(firmware_file, socket_device, monkeypatch):
+    monkeypatch.setattr("alarmdecoder.util.firmware._ACK_TIMEOUT_MS", 10)
+    device, remote = socket_device
+
+    with pytest.raises(TimeoutError):
+        Firmware.upload(device, firmware_file)
+
+
+@pytest.mark.parametrize("responses", [b">\r\n>\r\n!no\r\n", b">>\r\n!ce\r\n"])
+def test_upload_reports_rejected_record_from_batched_acks(firmware_file, socket_device, responses):
+    device, remote = socket_device
+
+    remote.sendall(responses)
+    with pytest.raises(UploadError, match="Incorrect data"):
+        Firmware.upload(device, firmware_file)
+
+
+def test_upload_rejects_response_after_every_record_acked(tmp_path, socket_device, monkeypatch):
+    monkeypatch.setattr("alarmdecoder.util.firmware.time.sleep", lambda _: None)
+    path = tmp_path / "short.hex"
+    path.write_text("\n".join(HEX_LINES[:2]) + "\n")
+    device, remote = socket_device
+
+    remote.sendall(b">\r\n>\r\n!sn\r\n")
+    with pytest.raises(UploadError, match="Unexpected response"):
+        Firmware.upload(device, str(path))
+
+
+def test_upload_uses_device_fd_when_available(firmware_file, socket_device, monkeypatch):
+    device, remote = socket_device
+    monkeypatch.setattr(device, "read_line", None)
+
+    remote.sendall(b">\r\n" * len(HEX_LINES))
+    Firmware.upload(device, firmware_file)
+
+    expected = "".join(line + "\r\n" for line in HEX_LINES).encode("ascii")
+    assert remote.recv(4096) == b"\n\n+++\n" + expected
+
+
+def test_upload_reassembles_acks_split_across_reads(firmware_file, socket_device, monkeypatch):
+    device, remote = socket_device
+    read = os.read
+    monkeypatch.setattr("alarmdecoder.util.firmware.os.read", lambda fd, size: read(fd, 1))
+
+    remote.sendall(b">\r\n>\r\n!no\r\n")
+    with pytest.raises(UploadError, match="Incorrect data"):
+        Firmware.upload(device, firmware_file)
+
+
+def test_upload_writes_each_window_with_one_syscall(firmware_file, socket_device, monkeypatch):
+    device, remote = socket_device
+    writes = []
+    write = os.write
+
+    def counting_write(fd, data):
+        writes.append(bytes(data))
+        return write(fd, data)
+
+    monkeypatch.setattr("alarmdecoder.util.firmware.os.write", counting_write)
+
+    remote.sendall(b">\r\n" * len(HEX_LINES))
+    Firmware.upload(device, firmware_file, window_size=len(HEX_LINES))
+
+    assert writes == ["".join(line + "\r\n" for line in HEX_LINES).encode("ascii")]
+
+
+@pytest.mark.parametrize("ssl, buffered", [(True, b""), (False, b">\r\n")])
+def test_upload_falls_back_to_read_line(firmware_file, socket_device, ssl, buffered):
+    device, remote = socket_device
+    device.ssl = ssl
+    device._buffer.extend(buffered)
+
+    assert _fd_io(device) is None
+
+    remote.sendall(b">\r\n" * (len(HEX_LINES) - len(buffered) // 3))
+    Firmware.upload(device, firmware_file)
+
+    assert device._buffer == b""
+
+
+def test_bytes_available_on_open_and_closed_socket():
+    local, remote = socket.socketpair()
+    try:
+        assert bytes_available(local) == 0
+        remote.sendall(b"x")
+        assert bytes_available(local) == 1
+    finally:
+        local.close()
+        remote.close()
+
+    assert bytes_available(local) == 0
+
+
+def test_upload_over_serial_waits_for_a_full_tty_buffer(tmp_path, pty_serial_device, monkeypatch):
+    monkeypatch.setattr("alarmdecoder.util.firmware.time.sleep", lambda _: None)
+    record_count = 2000
+    path = tmp_path / "large.hex"
+    path.write_text((HEX_LINES[0] + "\n") * record_count)
+    device, master = pty_serial_device
+    written = []
+    device.on_write += lambda sender, data: written.append(data)
+    assert _fd_io(device) is not None
+
+    def bootloader():
+        # Drain the whole window before answering, so the upload has to wait
+        # for the tty output buffer to empty more than once.
+        received = 0
+        while received < record_count:
+            received += os.read(master, 4096).count(b":")
+        acks = memoryview(b">\r\n" * record_count)
+        while acks:
+            acks = acks[os.write(master, acks):]
+
+    thread = threading.Thread(target=bootloader, daemon=True)
+    thread.start()
+    Firmware.upload(device, str(path), window_size=record_count)
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert written[-1] == (HEX_LINES[0] + "\r\n").encode("ascii") * record_count